@@ -2,18 +2,33 @@ from collections.abc import Callable
 from pathlib import Path
 from typing import Union
 
+import orjson
 from aiohttp import hdrs, web, web_exceptions
 from navigator.extensions import BaseExtension
 from navigator.responses import Response
 from navigator_auth.decorators import allowed_groups
-from navigator_auth.exceptions import UserNotFound
+from navigator_auth.exceptions import AuthException, UserNotFound
 from navigator_session import get_session
+from .audit import AuditLog
+from .jobs import JobManager
+from .stats import StatsRefresher
+from .throttle import LoginThrottle
+from .slowlog import SlowQueryLog
+from .bus import InvalidationBus, session_key
+from .encoders import clear_encoders
+from .compression import Compressor
+from .handler import session_member
+
+
+def json_dumps(obj) -> str:
+    return orjson.dumps(obj, default=str).decode()
 
 
 class AdminPanel(BaseExtension):
     name: str = 'auth'
     app: web.Application = None
     routes: list = []
+    allowed_groups: list = ['superuser']
 
     def __init__(
             self,
@@ -21,10 +36,33 @@ class AdminPanel(BaseExtension):
             uri_prefix: str = '/admin',
             title: str = 'Navigator Admin',
             template_path: Union[str, Path] = None,
+            audit: AuditLog = None,
+            jobs: JobManager = None,
+            stats: StatsRefresher = None,
+            throttle: LoginThrottle = None,
+            slowlog: SlowQueryLog = None,
+            bus: InvalidationBus = None,
+            compression: Compressor = None,
             **kwargs
         ) -> None:
         self.uri_prefix = uri_prefix
         self.title = title
+        # Audit Log of write operations (disabled if None)
+        self.audit = audit
+        # Background Jobs for long operations:
+        self.jobs = jobs if jobs is not None else JobManager()
+        # Dashboard statistics (disabled if None)
+        self.stats = stats
+        # Login admission control (disabled if None)
+        self.throttle = throttle
+        # Slow Query Log (disabled if None)
+        self.slowlog = slowlog
+        # Invalidation Bus between workers (disabled if None)
+        self.bus = bus
+        # Response Compression of Admin JSON payloads:
+        self.compression = compression if compression is not None else Compressor()
+        # registered models: {model name: (route name, model)}
+        self._models: dict = {}
         if isinstance(template_path, str):
             self.template_path = Path(template_path).resolve()
         super(AdminPanel, self).__init__(
@@ -48,6 +86,9 @@ class AdminPanel(BaseExtension):
         }
         cls.uri_prefix = self.uri_prefix
         self.routes.append(r)
+        self._models[cls.model.__name__] = (route_name, cls.model)
+        if self.stats is not None:
+            self.stats.register(route_name, cls.model)
 
 
 
@@ -80,11 +121,149 @@ class AdminPanel(BaseExtension):
             self.admin_logout,
             name="admin_logout"
         )
+        # Background Jobs:
+        router.add_route(
+            "GET",
+            f"{self.uri_prefix}/:jobs",
+            self.admin_jobs,
+            name="admin_jobs"
+        )
+        router.add_route(
+            "*",
+            f"{self.uri_prefix}/:jobs/{{job_id}}",
+            self.admin_job,
+            name="admin_job"
+        )
+        # Slow Queries:
+        router.add_route(
+            "GET",
+            f"{self.uri_prefix}/:slowlog",
+            self.admin_slowlog,
+            name="admin_slowlog"
+        )
         ### added declared admin handlers
+        if self.audit is not None:
+            app['admin_audit'] = self.audit
+        if self.slowlog is not None:
+            app['admin_slowlog'] = self.slowlog
+        if self.bus is not None:
+            app['admin_bus'] = self.bus
+            self.bus.subscribe(self.invalidated)
+            self.bus.subscribe(self.job_cancelled)
+        app['admin_jobs'] = self.jobs
+        app['admin_compressor'] = self.compression
+        app.on_startup.append(self.admin_startup)
+        app.on_shutdown.append(self.admin_shutdown)
+
+    async def admin_startup(self, app: web.Application) -> None:
+        await self.jobs.start(app)
+        if self.bus is not None:
+            await self.bus.start(app)
+        if self.audit is not None:
+            await self.audit.start(app)
+        if self.stats is not None:
+            await self.stats.start(app)
+        if self.slowlog is not None:
+            await self.slowlog.start(app)
+
+    async def admin_shutdown(self, app: web.Application) -> None:
+        await self.jobs.stop()
+        if self.audit is not None:
+            await self.audit.stop()
+        if self.stats is not None:
+            await self.stats.stop()
+        if self.slowlog is not None:
+            await self.slowlog.stop()
+        if self.bus is not None:
+            await self.bus.stop()
+
+    async def schema_changed(self, name: str) -> None:
+        """Drop the caches derived from the schema of a Model (ex: after a
+        migration) on every worker, or only on this one without a Bus."""
+        if self.bus is not None:
+            await self.bus.schema(name)
+        else:
+            self.invalidated('schema', name)
+
+    def invalidated(self, kind: str, key: str) -> None:
+        """Drop the in-process caches of a Model whose schema changed."""
+        if kind != 'schema' or key not in self._models:
+            return
+        route_name, model = self._models[key]
+        clear_encoders(model)
+        # precompressed schema bodies:
+        self.compression.cache.clear(model)
+        if self.stats is not None:
+            self.stats.reset(route_name)
+
+    def job_cancelled(self, kind: str, key: str) -> None:
+        """Cancel a Job (if running on this worker) cancelled on any worker."""
+        if kind == 'cancel':
+            self.jobs.cancel(key)
+
+    async def check_session(self, request: web.Request):
+        """Session of an authenticated member of ``allowed_groups``."""
+        if request.get('authenticated', False) is False:
+            raise web.HTTPUnauthorized(
+                reason="Unauthorized: Access Denied to this resource."
+            )
+        session = await get_session(request)
+        if not session:
+            raise web.HTTPUnauthorized(
+                reason="Unauthorized: Access Denied to this resource."
+            )
+        if session_member(session, self.allowed_groups) is False:
+            raise web.HTTPUnauthorized(reason="Access Denied")
+        if self.is_revoked(session):
+            raise web.HTTPUnauthorized(reason="Session was revoked")
+        return session
+
+    def is_revoked(self, session) -> bool:
+        if self.bus is None:
+            return False
+        return self.bus.is_revoked(session_key(session))
+
+    async def admin_jobs(self, request: web.Request) -> web.StreamResponse:
+        """List of background Jobs."""
+        await self.check_session(request)
+        jobs = [job.to_dict() for job in await self.jobs.store.fetch_all()]
+        return web.json_response(jobs, dumps=json_dumps)
+
+    async def admin_job(self, request: web.Request) -> web.StreamResponse:
+        """Status (GET) or Cancellation (DELETE) of a background Job.
+
+        Jobs of other workers are found if the JobStore has a ``path``;
+        they are cancelled through the Invalidation Bus (without a Bus,
+        only the Jobs running on this worker can be cancelled).
+        """
+        await self.check_session(request)
+        job_id = request.match_info['job_id']
+        if request.method == 'GET':
+            job = await self.jobs.store.fetch(job_id)
+        elif request.method == 'DELETE':
+            job = await self.jobs.store.fetch(job_id)
+            if job is not None and not job.finished:
+                if self.bus is not None:
+                    await self.bus.cancel_job(job_id)
+                else:
+                    self.jobs.cancel(job_id)
+        else:
+            raise web_exceptions.HTTPMethodNotAllowed(
+                request.method, ['GET', 'DELETE']
+            )
+        if job is None:
+            raise web.HTTPNotFound(
+                reason=f"Job {job_id} was not Found"
+            )
+        return web.json_response(job.to_dict(), dumps=json_dumps)
 
     async def admin_logout(self, request: web.Request) -> web.StreamResponse:
         auth = request.app["auth"]
         location = request.app.router['admin_login'].url_for()
+        if self.bus is not None:
+            session = await get_session(request)
+            if key := session_key(session):
+                await self.bus.revoke_session(key)
         try:
             response = web.HTTPFound(location=location)
             await auth.session.storage.forgot(request, response)
@@ -113,6 +292,26 @@ class AdminPanel(BaseExtension):
             auth = request.app["auth"]
             try:
                 backend = auth.backends[auth_method]
+            except KeyError as ex:
+                raise web.HTTPBadRequest(
+                    reason="API Key Backend Auth is not enabled.",
+                    headers={
+                        hdrs.CONTENT_TYPE: 'text/html',
+                        hdrs.CONNECTION: 'keep-alive',
+                    }
+                ) from ex
+            throttle = self.throttle
+            username = None
+            if throttle is not None:
+                # rejected before any credential check:
+                try:
+                    username, _ = await backend.get_payload(request)
+                except (AttributeError, TypeError, ValueError):
+                    username = None
+                if wait := throttle.check(throttle.client_ip(request), username):
+                    raise throttle.reject(wait)
+                await throttle.acquire()
+            try:
                 if userdata := await backend.authenticate(request):
                     location = request.app.router['admin_index'].url_for()
                     token = userdata['token']
@@ -123,6 +322,8 @@ class AdminPanel(BaseExtension):
                     await auth.session.storage.load_session(request, userdata, response=response)
                     raise response
                 else:
+                    if throttle is not None:
+                        throttle.failed(username)
                     raise web.HTTPUnauthorized(
                         reason="Unauthorized: Access Denied to this resource.",
                         headers={
@@ -131,9 +332,15 @@ class AdminPanel(BaseExtension):
                         }
                     )
             except UserNotFound as err:
+                if throttle is not None:
+                    throttle.failed(username)
                 raise web.HTTPForbidden(
                     reason=f"{err.message}"
                 )
+            except AuthException:
+                if throttle is not None:
+                    throttle.failed(username)
+                raise
             except KeyError as ex:
                 raise web.HTTPBadRequest(
                     reason="API Key Backend Auth is not enabled.",
@@ -142,6 +349,9 @@ class AdminPanel(BaseExtension):
                         hdrs.CONNECTION: 'keep-alive',
                     }
                 ) from ex
+            finally:
+                if throttle is not None:
+                    throttle.release()
         else:
             raise web_exceptions.HTTPMethodNotAllowed()
 
@@ -152,12 +362,33 @@ class AdminPanel(BaseExtension):
         session = await get_session(request)
         if not session: # also there is no session:
             raise web.HTTPFound(location=location)
+        if self.is_revoked(session):
+            raise web.HTTPFound(location=location)
         view = request.app['template'].view
         args = {
             "page_url": "localhost",
             "title": self.title,
             "main_url": self.uri_prefix,
             "logout_url": f"{self.uri_prefix}/logout",
-            "admin_routes": self.routes
+            "admin_routes": self.routes,
+            "admin_stats": self.stats.snapshot() if self.stats is not None else []
         }
         return await view('index.html', args)
+
+    async def admin_slowlog(self, request: web.Request) -> web.StreamResponse:
+        """Slow Queries page (or JSON list if requested)."""
+        await self.check_session(request)
+        queries = self.slowlog.entries() if self.slowlog is not None else []
+        if 'application/json' in request.headers.get(hdrs.ACCEPT, ''):
+            return web.json_response(queries, dumps=json_dumps)
+        view = request.app['template'].view
+        args = {
+            "page_url": "localhost",
+            "title": "Slow Queries",
+            "main_url": self.uri_prefix,
+            "logout_url": f"{self.uri_prefix}/logout",
+            "admin_routes": self.routes,
+            "threshold": self.slowlog.threshold if self.slowlog is not None else None,
+            "queries": queries
+        }
+        return await view('slowlog.html', args)
@@ -0,0 +1,224 @@
+"""
+Audit Log: asynchronous and batched record of Admin write operations.
+"""
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Optional, Union
+import orjson
+from aiohttp import web
+
+
+def audit_diff(before: Optional[dict], after: Optional[dict]) -> dict:
+    """Changed fields between two versions of a record as {field: [old, new]}."""
+    before = before or {}
+    after = after or {}
+    diff = {}
+    for key in before.keys() | after.keys():
+        old = before.get(key, None)
+        new = after.get(key, None)
+        if old != new:
+            diff[key] = [old, new]
+    return diff
+
+
+def audit_json(obj: Any) -> bytes:
+    return orjson.dumps(
+        obj,
+        option=orjson.OPT_NON_STR_KEYS,
+        default=str
+    )
+
+
+class AuditSink(ABC):
+    """AuditSink.
+
+    Destination of the Audit Records, receives the records in batches.
+    """
+    async def open(self, app: web.Application) -> None:
+        pass
+
+    @abstractmethod
+    async def write(self, records: list) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
+
+
+class JSONLinesSink(AuditSink):
+    """JSONLinesSink.
+
+    Append Audit Records into a JSON-lines file, the file write is
+    made in the default executor.
+    """
+    def __init__(self, filename: Union[str, Path]) -> None:
+        self.filename = Path(filename).resolve()
+
+    def _append(self, data: bytes) -> None:
+        with open(self.filename, 'ab') as fp:
+            fp.write(data)
+
+    async def open(self, app: web.Application) -> None:
+        self.filename.parent.mkdir(parents=True, exist_ok=True)
+
+    async def write(self, records: list) -> None:
+        data = b''.join(audit_json(r) + b'\n' for r in records)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._append, data)
+
+
+class DBSink(AuditSink):
+    """DBSink.
+
+    Insert Audit Records into a Database Table, one ``executemany`` per batch.
+
+    Expected table:
+        ts timestamp, username varchar, handler varchar, pk jsonb,
+        verb varchar, diff jsonb
+    """
+    def __init__(self, table: str = 'auth.audit_log', db_name: str = 'authdb') -> None:
+        self.table = table
+        self.db_name = db_name
+        self._db = None
+
+    async def open(self, app: web.Application) -> None:
+        self._db = app[self.db_name]
+
+    async def write(self, records: list) -> None:
+        sql = (
+            f"INSERT INTO {self.table} (ts, username, handler, pk, verb, diff) "
+            "VALUES ($1, $2, $3, $4, $5, $6)"
+        )
+        args = [
+            (
+                r['ts'],
+                r['user'],
+                r['handler'],
+                audit_json(r['pk']).decode(),
+                r['verb'],
+                audit_json(r['diff']).decode()
+            ) for r in records
+        ]
+        async with await self._db.acquire() as conn:
+            _, error = await conn.execute_many(sql, args)
+            if error:
+                raise RuntimeError(f"Audit insert error: {error}")
+
+
+class AuditLog:
+    """AuditLog.
+
+    Audit records are put on a bounded in-process Queue (no I/O on the
+    request path) and a background Task flushes them in batches into
+    the Sink; the diff between versions is calculated on the Task.
+    """
+    def __init__(
+        self,
+        sink: AuditSink,
+        max_size: int = 10000,
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        shutdown_timeout: float = 10.0
+    ) -> None:
+        self.sink = sink
+        self.max_size = max_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.shutdown_timeout = shutdown_timeout
+        self.dropped: int = 0
+        # created on start(), bound to the running loop:
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self.logger = logging.getLogger('Navigator.Admin.Audit')
+
+    def record(
+        self,
+        user: Any,
+        handler: str,
+        pk: Any,
+        verb: str,
+        before: Optional[dict] = None,
+        after: Optional[dict] = None
+    ) -> None:
+        """Enqueue an Audit Record, never blocks the caller."""
+        if self._queue is None:
+            self.dropped += 1
+            self.logger.warning("Audit Log is not started, record dropped")
+            return
+        try:
+            self._queue.put_nowait(
+                {
+                    "ts": datetime.utcnow(),
+                    "user": user,
+                    "handler": handler,
+                    "pk": pk,
+                    "verb": verb,
+                    "before": before,
+                    "after": after
+                }
+            )
+        except asyncio.QueueFull:
+            self.dropped += 1
+            self.logger.warning(
+                f"Audit Queue is full, record dropped ({self.dropped} dropped)"
+            )
+
+    async def start(self, app: web.Application) -> None:
+        await self.sink.open(app)
+        self._queue = asyncio.Queue(maxsize=self.max_size)
+        self._task = asyncio.create_task(
+            self._worker(), name='admin_audit'
+        )
+
+    async def stop(self) -> None:
+        """Flush the pending records and stop the background Task."""
+        if self._task is None:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=self.shutdown_timeout)
+        except asyncio.TimeoutError:
+            self.logger.error(
+                f"Audit Log closed with {self._queue.qsize()} pending records"
+            )
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        await self.sink.close()
+
+    def _batch(self, first: dict) -> list:
+        batch = [first]
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
+    async def _worker(self) -> None:
+        while True:
+            first = await self._queue.get()
+            # wait a little for a fuller batch:
+            if self._queue.qsize() < self.batch_size:
+                await asyncio.sleep(self.flush_interval)
+            batch = self._batch(first)
+            records = []
+            for r in batch:
+                before = r.pop('before')
+                after = r.pop('after')
+                r['diff'] = audit_diff(before, after)
+                records.append(r)
+            try:
+                await self.sink.write(records)
+            except Exception as ex:  # pylint: disable=W0703
+                self.logger.exception(
+                    f"Error writing {len(records)} Audit records: {ex}"
+                )
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
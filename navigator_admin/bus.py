@@ -0,0 +1,239 @@
+"""
+Invalidation Bus: broadcast of cache invalidations between Admin workers.
+"""
+import asyncio
+import logging
+import os
+import socket
+import tempfile
+import time
+import uuid
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, Optional, Union
+import orjson
+from aiohttp import web
+
+
+def session_key(session: Any) -> Optional[str]:
+    """Identifier of a Session used on revocations.
+
+    Only the session id: an user identity would revoke every session
+    of the user.
+    """
+    if key := getattr(session, 'session_id', None):
+        return str(key)
+    return None
+
+
+class InvalidationBus(ABC):
+    """InvalidationBus.
+
+    Broadcast invalidation messages to every worker process:
+      * ``schema``: the schema of a Model changed (drop its derived caches).
+      * ``revoke``: a Session revoked (ex: on logout).
+      * ``cancel``: a background Job cancelled (on the worker running it).
+
+    Messages are dispatched to the local subscribers, then sent to the
+    other workers, which dispatch them to their own subscribers.
+    """
+    def __init__(self, revoked_ttl: int = 3600, max_revoked: int = 10000) -> None:
+        self.origin: str = uuid.uuid4().hex
+        self.revoked_ttl = revoked_ttl
+        self.max_revoked = max_revoked
+        self._revoked: OrderedDict = OrderedDict()
+        self._subscribers: list = []
+        self.logger = logging.getLogger('Navigator.Admin.Bus')
+
+    def subscribe(self, callback: Callable[[str, str], Any]) -> None:
+        """Register a ``callback(kind, key)`` for every message."""
+        self._subscribers.append(callback)
+
+    def is_revoked(self, session_id: Optional[str]) -> bool:
+        if not session_id:
+            return False
+        try:
+            expires = self._revoked[session_id]
+        except KeyError:
+            return False
+        if expires < time.monotonic():
+            del self._revoked[session_id]
+            return False
+        return True
+
+    async def schema(self, name: str) -> None:
+        await self.publish({"kind": "schema", "key": name})
+
+    async def cancel_job(self, job_id: str) -> None:
+        await self.publish({"kind": "cancel", "key": job_id})
+
+    async def revoke_session(self, session_id: str) -> None:
+        await self.publish({"kind": "revoke", "key": session_id})
+
+    async def publish(self, message: dict) -> None:
+        message['origin'] = self.origin
+        self.dispatch(message)
+        try:
+            await self._send(orjson.dumps(message))
+        except Exception as ex:  # pylint: disable=W0703
+            self.logger.error(f"Unable to broadcast {message!r}: {ex}")
+
+    def received(self, data: bytes) -> None:
+        """Dispatch a message received from another worker."""
+        try:
+            message = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            self.logger.warning(f"Invalid Bus message: {data!r}")
+            return
+        if message.get('origin', None) != self.origin:
+            self.dispatch(message)
+
+    def dispatch(self, message: dict) -> None:
+        kind = message['kind']
+        key = message['key']
+        if kind == 'revoke':
+            self._revoked[key] = time.monotonic() + self.revoked_ttl
+            self._revoked.move_to_end(key)
+            while len(self._revoked) > self.max_revoked:
+                self._revoked.popitem(last=False)
+        for callback in self._subscribers:
+            try:
+                callback(kind, key)
+            except Exception as ex:  # pylint: disable=W0703
+                self.logger.exception(f"Error on Bus subscriber {callback!r}: {ex}")
+
+    @abstractmethod
+    async def start(self, app: web.Application) -> None:
+        pass
+
+    @abstractmethod
+    async def stop(self) -> None:
+        pass
+
+    @abstractmethod
+    async def _send(self, data: bytes) -> None:
+        pass
+
+
+class LocalBus(InvalidationBus):
+    """LocalBus.
+
+    Invalidation Bus between the workers of the same host, with no external
+    service: every worker binds a Unix datagram socket into a shared
+    directory and sends the messages to all the other sockets on it.
+
+    The directory (by default ``<tmp>/<namespace>-<uid>``, use a different
+    ``namespace`` per application) is private to the user running the
+    workers.
+    """
+    def __init__(
+        self,
+        path: Union[str, Path] = None,
+        namespace: str = 'navigator_admin',
+        **kwargs
+    ) -> None:
+        super(LocalBus, self).__init__(**kwargs)
+        if path is None:
+            path = Path(tempfile.gettempdir()).joinpath(f"{namespace}-{os.getuid()}")
+        self.path = Path(path).resolve()
+        self._address: Optional[Path] = None
+        self._sender: Optional[socket.socket] = None
+        self._transport = None
+
+    def _mkdir(self) -> None:
+        self.path.mkdir(mode=0o700, parents=True, exist_ok=True)
+        if self.path.stat().st_uid != os.getuid():
+            raise RuntimeError(
+                f"Bus directory {self.path} is owned by another user"
+            )
+        # mkdir mode is masked by umask and not applied if already exists:
+        self.path.chmod(0o700)
+
+    async def start(self, app: web.Application) -> None:
+        self._mkdir()
+        self._address = self.path.joinpath(f"{os.getpid()}-{self.origin[:8]}.sock")
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        sock.bind(str(self._address))
+        sock.setblocking(False)
+        bus = self
+
+        class _Protocol(asyncio.DatagramProtocol):
+            def datagram_received(self, data, addr):
+                bus.received(data)
+
+        loop = asyncio.get_running_loop()
+        self._transport, _ = await loop.create_datagram_endpoint(
+            _Protocol, sock=sock
+        )
+        self._sender = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._sender.setblocking(False)
+
+    async def stop(self) -> None:
+        if self._transport is not None:
+            self._transport.close()
+            self._transport = None
+        if self._sender is not None:
+            self._sender.close()
+            self._sender = None
+        if self._address is not None and self._address.exists():
+            self._address.unlink()
+
+    async def _send(self, data: bytes) -> None:
+        if self._sender is None:
+            return
+        for peer in self.path.glob('*.sock'):
+            if peer == self._address:
+                continue
+            try:
+                self._sender.sendto(data, str(peer))
+            except (ConnectionRefusedError, FileNotFoundError):
+                # the worker is gone:
+                peer.unlink(missing_ok=True)
+            except BlockingIOError:
+                self.logger.warning(f"Bus peer {peer.name} is busy, message dropped")
+
+
+class BrokerBus(InvalidationBus):
+    """BrokerBus.
+
+    Interface of an Invalidation Bus over an external Broker (ex: Redis
+    Pub/Sub, for workers on several hosts): implement ``connect``,
+    ``disconnect``, ``_send`` (publish on ``channel``) and ``listen``
+    (an async iterator of the received messages).
+    """
+    def __init__(self, channel: str = 'navigator_admin', **kwargs) -> None:
+        super(BrokerBus, self).__init__(**kwargs)
+        self.channel = channel
+        self._task: Optional[asyncio.Task] = None
+
+    @abstractmethod
+    async def connect(self, app: web.Application) -> None:
+        pass
+
+    @abstractmethod
+    async def disconnect(self) -> None:
+        pass
+
+    @abstractmethod
+    def listen(self):
+        """Async iterator of the messages (bytes) received on channel."""
+
+    async def _listener(self) -> None:
+        async for data in self.listen():
+            self.received(data)
+
+    async def start(self, app: web.Application) -> None:
+        await self.connect(app)
+        self._task = asyncio.create_task(self._listener(), name='admin_bus')
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.disconnect()
@@ -0,0 +1,217 @@
+"""
+Compression: negotiated compression of Admin responses.
+"""
+import asyncio
+import zlib
+from collections.abc import Callable
+from typing import Any, Optional
+from aiohttp import hdrs, web
+try:
+    import brotli
+except ImportError:
+    brotli = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+def available_encodings() -> tuple:
+    encodings = []
+    if brotli is not None:
+        encodings.append('br')
+    if zstandard is not None:
+        encodings.append('zstd')
+    encodings.append('gzip')
+    return tuple(encodings)
+
+
+class CompressedStream:
+    """CompressedStream.
+
+    Wrapper of a prepared StreamResponse that compresses every chunk
+    written with an incremental compressor; chunks larger than
+    ``executor_threshold`` bytes are compressed on the default executor.
+    """
+    def __init__(
+        self,
+        response: web.StreamResponse,
+        compressor: Any,
+        executor_threshold: Optional[int] = None
+    ) -> None:
+        self.response = response
+        self._compressor = compressor
+        self.executor_threshold = executor_threshold
+
+    async def write(self, data: bytes) -> None:
+        if self.executor_threshold is not None and len(data) >= self.executor_threshold:
+            # chunks are written one at a time, never compressed concurrently:
+            loop = asyncio.get_running_loop()
+            chunk = await loop.run_in_executor(None, self._compressor.compress, data)
+        else:
+            chunk = self._compressor.compress(data)
+        if chunk:
+            await self.response.write(chunk)
+
+    async def write_eof(self) -> None:
+        if chunk := self._compressor.flush():
+            await self.response.write(chunk)
+        await self.response.write_eof()
+
+
+class BodyCache:
+    """BodyCache.
+
+    Precomputed bodies (ex: Model schemas) built once and stored already
+    compressed for every negotiated encoding.
+    """
+    def __init__(self) -> None:
+        self._bodies: dict = {}
+
+    async def get(
+        self,
+        key: Any,
+        encoding: Optional[str],
+        compressor: 'Compressor',
+        build: Callable[[], bytes]
+    ) -> tuple:
+        """Returns (body, encoding), body is not compressed if too small."""
+        try:
+            raw = self._bodies[(key, None)]
+        except KeyError:
+            raw = self._bodies[(key, None)] = build()
+        if encoding is None or len(raw) < compressor.threshold:
+            return raw, None
+        try:
+            return self._bodies[(key, encoding)], encoding
+        except KeyError:
+            body = await compressor.compress_async(raw, encoding)
+            self._bodies[(key, encoding)] = body
+            return body, encoding
+
+    def clear(self, key: Any = None) -> None:
+        if key is None:
+            self._bodies.clear()
+            return
+        for k in [k for k in self._bodies if k[0] == key]:
+            del self._bodies[k]
+
+
+class Compressor:
+    """Compressor.
+
+    Negotiate the encoding (brotli, zstd or gzip) from ``Accept-Encoding``
+    and compress the bodies larger than ``threshold`` bytes; bodies larger
+    than ``executor_threshold`` are compressed on the default executor.
+    """
+    def __init__(
+        self,
+        threshold: int = 1024,
+        executor_threshold: int = 256 * 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 5,
+        zstd_level: int = 3,
+        encodings: tuple = None
+    ) -> None:
+        self.threshold = threshold
+        self.executor_threshold = executor_threshold
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.zstd_level = zstd_level
+        available = available_encodings()
+        # server preference order:
+        self.encodings = tuple(
+            e for e in (encodings or available) if e in available
+        )
+        self.cache = BodyCache()
+
+    def negotiate(self, request: web.Request) -> Optional[str]:
+        """Preferred encoding accepted by client, None if no one."""
+        header = request.headers.get(hdrs.ACCEPT_ENCODING, '')
+        accepted = {}
+        for item in header.split(','):
+            name, _, params = item.strip().partition(';')
+            quality = 1.0
+            params = params.strip()
+            if params.startswith('q='):
+                try:
+                    quality = float(params[2:])
+                except ValueError:
+                    quality = 0.0
+            accepted[name.strip().lower()] = quality
+        for encoding in self.encodings:
+            if accepted.get(encoding, accepted.get('*', 0)) > 0:
+                return encoding
+        return None
+
+    def compress(self, data: bytes, encoding: str) -> bytes:
+        if encoding == 'br':
+            return brotli.compress(data, quality=self.brotli_quality)
+        elif encoding == 'zstd':
+            return zstandard.ZstdCompressor(level=self.zstd_level).compress(data)
+        # gzip container (wbits 16 + 15):
+        obj = zlib.compressobj(self.gzip_level, zlib.DEFLATED, 31)
+        return obj.compress(data) + obj.flush()
+
+    async def compress_async(self, data: bytes, encoding: str) -> bytes:
+        if len(data) < self.executor_threshold:
+            return self.compress(data, encoding)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.compress, data, encoding)
+
+    def compressobj(self, encoding: str) -> Any:
+        """Incremental compressor (``compress`` and ``flush``) of encoding."""
+        if encoding == 'br':
+            return _BrotliStream(brotli.Compressor(quality=self.brotli_quality))
+        elif encoding == 'zstd':
+            return zstandard.ZstdCompressor(level=self.zstd_level).compressobj()
+        return zlib.compressobj(self.gzip_level, zlib.DEFLATED, 31)
+
+    def set_headers(self, response: web.StreamResponse, encoding: str) -> None:
+        response.headers[hdrs.CONTENT_ENCODING] = encoding
+        response.headers.add(hdrs.VARY, hdrs.ACCEPT_ENCODING)
+
+    async def compress_response(
+        self,
+        request: web.Request,
+        response: web.Response
+    ) -> web.Response:
+        """Compress the body of a Response, if negotiated and large enough."""
+        body = response.body
+        if not isinstance(body, bytes) or len(body) < self.threshold:
+            return response
+        if hdrs.CONTENT_ENCODING in response.headers:
+            return response
+        if not (encoding := self.negotiate(request)):
+            return response
+        response.body = await self.compress_async(body, encoding)
+        self.set_headers(response, encoding)
+        return response
+
+    async def stream(
+        self,
+        request: web.Request,
+        response: web.StreamResponse
+    ) -> Any:
+        """Prepare a StreamResponse, returns the writer (compressed if negotiated)."""
+        encoding = self.negotiate(request)
+        if encoding:
+            self.set_headers(response, encoding)
+        await response.prepare(request)
+        if encoding:
+            return CompressedStream(
+                response, self.compressobj(encoding), self.executor_threshold
+            )
+        return response
+
+
+class _BrotliStream:
+    """brotli.Compressor with the ``compress``/``flush`` interface of zlib."""
+    def __init__(self, compressor: Any) -> None:
+        self._compressor = compressor
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.finish()
@@ -0,0 +1,138 @@
+"""
+Record Encoders: serialize DB rows straight to JSON bytes (raw mode).
+"""
+import uuid
+from collections.abc import Callable
+from decimal import Decimal
+from typing import Any, Optional, Union, get_args, get_origin
+import orjson
+from datamodel import BaseModel
+from .related import model_table
+
+
+TEXT_TYPES = ('text', 'varchar', 'character varying', 'char', 'character')
+
+
+def json_default(obj: Any) -> Any:
+    if isinstance(obj, Decimal):
+        return float(obj)
+    return str(obj)
+
+
+def _to_json(value: Any) -> Any:
+    # dict/list fields stored on a text column:
+    if isinstance(value, (str, bytes)):
+        return orjson.loads(value)
+    return value
+
+
+def _to_float(value: Any) -> Any:
+    return None if value is None else float(value)
+
+
+def _to_str(value: Any) -> Any:
+    return None if value is None else str(value)
+
+
+def base_type(_type: Any) -> Any:
+    """Unwrap Optional[...] and generic aliases (list[str] -> list)."""
+    if get_origin(_type) is Union:
+        args = [a for a in get_args(_type) if a is not type(None)]
+        _type = args[0] if len(args) == 1 else _type
+    return get_origin(_type) or _type
+
+
+def column_converter(field: Any) -> Optional[Callable]:
+    """Converter of a column value into a JSON native type, None if the
+    driver value is already serialized by orjson.
+
+    json/jsonb columns are already decoded by the driver, only the
+    dict/list fields stored on a text column are parsed.
+    """
+    _type = base_type(getattr(field, 'type', None))
+    try:
+        dbtype = field.get_dbtype()
+    except AttributeError:
+        dbtype = None
+    if _type in (dict, list):
+        return _to_json if dbtype in TEXT_TYPES else None
+    if _type is Decimal:
+        return _to_float
+    if _type is uuid.UUID:
+        # driver returns its own UUID type:
+        return _to_str
+    return None
+
+
+def is_heavy(field: Any) -> bool:
+    """Large columns (json, text, binary) deferred from list reads."""
+    if base_type(getattr(field, 'type', None)) in (dict, list, bytes):
+        return True
+    try:
+        dbtype = field.get_dbtype()
+    except AttributeError:
+        return False
+    return dbtype in ('json', 'jsonb', 'text', 'bytea')
+
+
+class RecordEncoder:
+    """RecordEncoder.
+
+    Precomputed (per Model and list of columns) SELECT statement and
+    column converters, encode the driver rows into JSON bytes without
+    building Model instances.
+    """
+    def __init__(self, model: BaseModel, columns: list) -> None:
+        self.model = model
+        self.columns = list(columns)
+        self.sql = f"SELECT {', '.join(self.columns)} FROM {model_table(model)}"
+        self.converters = [
+            (name, fn) for name, fn in (
+                (name, column_converter(model.__columns__[name])) for name in self.columns
+            ) if fn is not None
+        ]
+
+    def row(self, record: Any) -> dict:
+        row = dict(record)
+        for name, fn in self.converters:
+            row[name] = fn(row[name])
+        return row
+
+    def rows(self, records: list) -> list:
+        if not records:
+            return []
+        if not self.converters:
+            return [dict(r) for r in records]
+        return [self.row(r) for r in records]
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(
+            obj,
+            option=orjson.OPT_NON_STR_KEYS,
+            default=json_default
+        )
+
+    def encode(self, records: list) -> bytes:
+        return self.dumps(self.rows(records))
+
+
+_encoders: dict = {}
+
+
+def get_encoder(model: BaseModel, columns: list) -> RecordEncoder:
+    """Cached RecordEncoder of a Model and list of columns."""
+    key = (model, tuple(columns))
+    try:
+        return _encoders[key]
+    except KeyError:
+        encoder = _encoders[key] = RecordEncoder(model, columns)
+        return encoder
+
+
+def clear_encoders(model: BaseModel = None) -> None:
+    """Forget the cached encoders (all, or only of a Model)."""
+    if model is None:
+        _encoders.clear()
+        return
+    for key in [k for k in _encoders if k[0] is model]:
+        del _encoders[key]
@@ -1,7 +1,8 @@
 """
 Model Handler: Abstract Model for managing Model with Views.
 """
-from typing import Union
+from typing import Any, Union
+import orjson
 from inflector import Inflector
 from aiohttp import web
 from datamodel import BaseModel
@@ -16,6 +17,37 @@ from navigator.views import BaseView
 from navigator_session import get_session, SessionData
 from navigator_auth.exceptions import AuthException
 from navigator_auth.conf import AUTH_SESSION_OBJECT
+from .related import RelatedLoader, model_table
+from .jobs import Job, JobManager, coerce_value, coerce_values, validate_rows
+from .encoders import get_encoder, is_heavy
+from .slowlog import untracked
+from .bus import session_key
+
+
+def session_member(session: SessionData, allowed_groups: list) -> bool:
+    """True if the Session user belongs to any of the allowed groups."""
+    try:
+        userinfo = session[AUTH_SESSION_OBJECT]
+    except (TypeError, KeyError):
+        userinfo = {}
+    if 'groups' in userinfo:
+        return bool(not set(userinfo['groups']).isdisjoint(allowed_groups))
+    elif session:
+        user = session.decode('user')
+        if user:
+            for group in user.groups:
+                if group.group in allowed_groups:
+                    return True
+    return False
+
+
+def session_user(session: SessionData) -> Any:
+    """Username (or user id) of the Session user."""
+    try:
+        userinfo = session[AUTH_SESSION_OBJECT]
+        return userinfo.get('username', None) or userinfo.get('user_id', None)
+    except (TypeError, KeyError, AttributeError):
+        return None
 
 
 class AdminHandler(BaseView):
@@ -23,7 +55,18 @@ class AdminHandler(BaseView):
     name: str = 'Model'
     pk: Union[str, list] = 'id'
     _columns: list = []
+    # related models for expansion: {'field': Model} or {'field': (Model, 'column')}
+    related: dict = {}
     uri_prefix: str = '/admin'
+    # raw mode: list reads encoded from DB rows, without Model instances
+    raw_mode: bool = False
+    export_chunk: int = 1000
+    # columns left out of list reads (loaded on detail or with ?fields=)
+    deferred: list = []
+    # also defer the heavy (json, text, binary) columns (opt-in)
+    defer_heavy: bool = False
+    # columns redacted on the Slow Query Log:
+    sensitive: list = []
 
     icon: str = 'book'
 
@@ -38,8 +81,7 @@ class AdminHandler(BaseView):
         self.__name__ = type(self).__name__
         if not self._columns:
             # calculated based on Model
-            for name in self.model.__columns__:
-                self._columns.append(name)
+            self._columns = list(self.model.__columns__)
         print(f'LOADED ADMIN MODEL FOR {self.__name__}')
         self.inflector = Inflector()
 
@@ -51,21 +93,7 @@ class AdminHandler(BaseView):
         session = None
         try:
             session = await get_session(self.request)
-            member = False
-            try:
-                userinfo = session[AUTH_SESSION_OBJECT]
-            except (TypeError, KeyError):
-                member = False
-                userinfo = {}
-            if 'groups' in userinfo:
-                member = bool(not set(userinfo['groups']).isdisjoint(self.allowed_groups))
-            elif session:
-                user = session.decode('user')
-                if user:
-                    for group in user.groups:
-                        if group.group in self.allowed_groups:
-                            member = True
-            if member is False:
+            if session_member(session, self.allowed_groups) is False:
                 raise web.HTTPUnauthorized(
                     reason="Access Denied"
                 )
@@ -110,6 +138,14 @@ class AdminHandler(BaseView):
                     reason="Unauthorized",
                     status=403
                 )
+            try:
+                bus = self.request.app['admin_bus']
+                if bus.is_revoked(session_key(session)):
+                    raise web.HTTPUnauthorized(
+                        reason="Session was revoked"
+                    )
+            except KeyError:
+                pass
             return session
         except web.HTTPUnauthorized:
             raise
@@ -119,6 +155,229 @@ class AdminHandler(BaseView):
                 status=403
             ) from ex
 
+    def audit_snapshot(self, obj: Any) -> Any:
+        """Copy of a Model before changes, None if Audit is not enabled."""
+        if 'admin_audit' not in self.request.app:
+            return None
+        return obj.to_dict() if isinstance(obj, BaseModel) else obj
+
+    def audit(
+        self,
+        session: SessionData,
+        verb: str,
+        pk: Any,
+        before: Any = None,
+        after: Any = None
+    ) -> None:
+        """Enqueue an Audit record of a write operation (if Audit is enabled)."""
+        try:
+            audit = self.request.app['admin_audit']
+        except KeyError:
+            return
+        user = session_user(session)
+        if isinstance(before, BaseModel):
+            before = before.to_dict()
+        if isinstance(after, BaseModel):
+            after = after.to_dict()
+        if pk is None and after:
+            # new record, PK is known after insert:
+            keys = [self.pk] if isinstance(self.pk, str) else self.pk
+            pk = {key: after.get(key, None) for key in keys}
+        audit.record(
+            user=user,
+            handler=self.name,
+            pk=pk,
+            verb=verb,
+            before=before,
+            after=after
+        )
+
+    def expand_fields(self) -> list:
+        """Related fields requested with ``?expand=field1,field2``."""
+        try:
+            expand = self.request.query['expand']
+        except KeyError:
+            return []
+        return [f.strip() for f in expand.split(',') if f.strip()]
+
+    async def expand_related(self, conn, result, fields: list):
+        """Resolve the related records of fields using the request Loader."""
+        relations = RelatedLoader.relations(self)
+        if invalid := [f for f in fields if f not in relations]:
+            raise ValueError(
+                f"Fields are not related on {self.name}: {invalid!r}"
+            )
+        try:
+            loader = self.request['admin_related']
+        except KeyError:
+            loader = RelatedLoader(conn)
+            self.request['admin_related'] = loader
+        if isinstance(result, list):
+            rows = [r.to_dict() if isinstance(r, BaseModel) else r for r in result]
+        else:
+            rows = result.to_dict() if isinstance(result, BaseModel) else result
+        return await loader.expand(rows, fields, relations)
+
+    def _statement(self, operation: str, args: dict = None, values: dict = None) -> tuple:
+        """SQL statement, columns and parameters made by a Model operation."""
+        table = model_table(self.model)
+        args = args or {}
+        values = {k: v for k, v in (values or {}).items() if k in self._columns}
+        if operation == 'insert':
+            cols = ', '.join(values)
+            placeholders = ', '.join(f"${i}" for i in range(1, len(values) + 1))
+            sql = f"INSERT INTO {table} ({cols}) VALUES ({placeholders})"
+            return sql, list(values), self._params(values)
+        where = ' AND '.join(
+            f"{k} = ${i}" for i, k in enumerate(args, len(values) + 1)
+        )
+        where = f" WHERE {where}" if where else ''
+        if operation == 'update':
+            sets = ', '.join(f"{k} = ${i}" for i, k in enumerate(values, 1))
+            sql = f"UPDATE {table} SET {sets}{where}"
+        elif operation == 'delete':
+            sql = f"DELETE FROM {table}{where}"
+        else:
+            sql = f"SELECT * FROM {table}{where}"
+        return sql, list(values) + list(args), self._params(values) + self._params(args)
+
+    def _params(self, data: dict) -> list:
+        """Statement parameters, converted by the Model fields (URL args are strings)."""
+        params = []
+        for key, value in data.items():
+            try:
+                value = coerce_value(self.model.__columns__[key], value)
+            except (KeyError, ValueError):
+                pass
+            params.append(value)
+        return params
+
+    def tracked(
+        self,
+        operation: str,
+        args: dict = None,
+        values: dict = None,
+        statement: str = None,
+        db_name: str = 'authdb'
+    ):
+        """Context Manager timing a DB operation (made on the
+        ``db_name`` pool of app) on the Slow Query Log."""
+        try:
+            slowlog = self.request.app['admin_slowlog']
+        except KeyError:
+            return untracked()
+        if statement is None:
+            statement, columns, params = self._statement(operation, args, values)
+        else:
+            columns, params = list(args or {}), self._params(args or {})
+        return slowlog.track(
+            self.name,
+            self.request.method.lower(),
+            operation,
+            statement,
+            params,
+            columns=columns,
+            sensitive=self.sensitive,
+            db_name=db_name
+        )
+
+    def deferred_fields(self) -> set:
+        """Declared deferred columns, plus the heavy ones if ``defer_heavy``."""
+        deferred = set(self.deferred)
+        if self.defer_heavy:
+            deferred.update(
+                name for name, field in self.model.__columns__.items() if is_heavy(field)
+            )
+        return deferred
+
+    def list_columns(self) -> list:
+        """Columns of a list read: ``?fields=`` or all but the deferred ones.
+
+        The ``?expand=`` fields are always read (never deferred).
+        """
+        expand = [f for f in self.expand_fields() if f in self._columns]
+        try:
+            fields = [f.strip() for f in self.request.query['fields'].split(',') if f.strip()]
+            if invalid := [f for f in fields if f not in self._columns]:
+                raise ValueError(
+                    f"Invalid fields for {self.name}: {invalid!r}"
+                )
+            return fields + [f for f in expand if f not in fields]
+        except KeyError:
+            pass
+        deferred = self.deferred_fields() - set(expand)
+        return [c for c in self._columns if c not in deferred]
+
+    def is_raw(self) -> bool:
+        """Raw mode is enabled on Handler or requested with ``?raw=true``."""
+        raw = self.request.query.get('raw', None)
+        if raw is None:
+            return self.raw_mode
+        return raw.lower() in ('1', 'true', 'yes')
+
+    def raw_response(self, body: bytes, status: int = 200) -> web.Response:
+        return web.Response(
+            body=body,
+            status=status,
+            content_type='application/json'
+        )
+
+    async def compressed(self, response: web.Response) -> web.Response:
+        """Compress the Response body if negotiated (and Compression is enabled)."""
+        try:
+            compressor = self.request.app['admin_compressor']
+        except KeyError:
+            return response
+        return await compressor.compress_response(self.request, response)
+
+    async def schema_response(self) -> web.Response:
+        """JSON schema of Model, cached already compressed."""
+        def build() -> bytes:
+            return orjson.dumps(self.model.schema(as_dict=True), default=str)
+        try:
+            compressor = self.request.app['admin_compressor']
+        except KeyError:
+            return self.raw_response(build())
+        body, encoding = await compressor.cache.get(
+            self.model, compressor.negotiate(self.request), compressor, build
+        )
+        response = self.raw_response(body)
+        if encoding:
+            compressor.set_headers(response, encoding)
+        return response
+
+    async def export(self, db) -> web.StreamResponse:
+        """Stream all records as a JSON array, encoded by chunks of rows."""
+        encoder = get_encoder(self.model, self._columns)
+        response = web.StreamResponse(
+            status=200,
+            headers={
+                "Content-Type": "application/json",
+                "Content-Disposition": f"attachment; filename={self.name}.json"
+            }
+        )
+        try:
+            compressor = self.request.app['admin_compressor']
+            writer = await compressor.stream(self.request, response)
+        except KeyError:
+            await response.prepare(self.request)
+            writer = response
+        await writer.write(b'[')
+        async with await db.acquire() as conn:
+            raw = conn.engine()
+            async with raw.transaction():
+                cursor = await raw.cursor(encoder.sql)
+                first = True
+                while rows := await cursor.fetch(self.export_chunk):
+                    if not first:
+                        await writer.write(b',')
+                    # strip the array brackets of every chunk:
+                    await writer.write(encoder.encode(rows)[1:-1])
+                    first = False
+        await writer.write(b']')
+        await writer.write_eof()
+        return response
+
     async def get(self):
         """ Getting Model information."""
         # TODO: filter capabilities
@@ -128,8 +387,9 @@ class AdminHandler(BaseView):
         try:
             if params['meta'] == ':meta':
                 # returning JSON schema of Model:
-                response = self.model.schema(as_dict=True)
-                return self.json_response(response)
+                return await self.schema_response()
+            elif params['meta'] == ':export':
+                return await self.export(self.request.app['database'])
         except KeyError:
             pass
         try:
@@ -193,7 +453,8 @@ class AdminHandler(BaseView):
                         "error": f"{self.name} was not Found"
                     }
                     try:
-                        result = await self.model.get(**args)
+                        async with self.tracked('get', args, db_name='database'):
+                            result = await self.model.get(**args)
                     except NoDataFound:
                         self.error(
                             exception=error,
@@ -204,14 +465,36 @@ class AdminHandler(BaseView):
                             exception=error,
                             status=403
                         )
-                    return self.json_response(result)
+                    if fields := self.expand_fields():
+                        try:
+                            result = await self.expand_related(conn, result, fields)
+                        except ValueError as ex:
+                            return self.error(
+                                reason=str(ex),
+                                status=400
+                            )
+                    return await self.compressed(self.json_response(result))
             else:
                 # TODO: add FILTER method
                 try:
                     async with await db.acquire() as conn:
+                        columns = self.list_columns()
+                        # projected columns are read without Model instances:
+                        if self.is_raw() or columns != self._columns:
+                            encoder = get_encoder(self.model, columns)
+                            async with self.tracked('all', statement=encoder.sql, db_name='database'):
+                                result = encoder.rows(await conn.fetch_all(encoder.sql))
+                            if fields := self.expand_fields():
+                                result = await self.expand_related(conn, result, fields)
+                            return await self.compressed(
+                                self.raw_response(encoder.dumps(result))
+                            )
                         self.model.Meta.connection = conn
-                        result = await self.model.all()
-                        return self.json_response(result)
+                        async with self.tracked('all', db_name='database'):
+                            result = await self.model.all()
+                        if fields := self.expand_fields():
+                            result = await self.expand_related(conn, result, fields)
+                        return await self.compressed(self.json_response(result))
                 except ValidationError as ex:
                     error = {
                         "error": f"Unable to load {self.name} info from Database",
@@ -230,7 +513,12 @@ class AdminHandler(BaseView):
                         exception=error,
                         status=406
                     )
-                except (DriverError, ProviderError, RuntimeError):
+                except ValueError as ex:
+                    return self.error(
+                        reason=str(ex),
+                        status=400
+                    )
+                except (DriverError, ProviderError, StatementError, RuntimeError) as ex:
                     error = {
                         "error": "Database Error",
                         "payload": str(ex),
@@ -261,7 +549,9 @@ class AdminHandler(BaseView):
             db = self.request.app['authdb']
             async with await db.acquire() as conn:
                 resultset.Meta.connection = conn
-                result = await resultset.insert()
+                async with self.tracked('insert', values=data):
+                    result = await resultset.insert()
+                self.audit(session, 'put', None, after=result)
                 return self.json_response(result, status=201)
         except ValidationError as ex:
             error = {
@@ -351,7 +641,8 @@ class AdminHandler(BaseView):
             async with await db.acquire() as conn:
                 self.model.Meta.connection = conn
                 try:
-                    result = await self.model.get(**args)
+                    async with self.tracked('get', args):
+                        result = await self.model.get(**args)
                 except NoDataFound:
                     headers = {
                         "x-error": f"{self.name} was not Found"
@@ -366,11 +657,15 @@ class AdminHandler(BaseView):
                     self.no_content(
                         headers=headers
                     )
+                # only copied if Audit is enabled (fields are changed below):
+                before = self.audit_snapshot(result)
                 ## saved with new changes:
                 for key, val in data.items():
                     if key in result.get_fields():
                         result.set(key, val)
-                data = await result.update()
+                async with self.tracked('update', args, values=data):
+                    data = await result.update()
+                self.audit(session, 'patch', args, before=before, after=data)
                 return self.json_response(data, status=202)
         else:
             self.error(
@@ -378,16 +673,201 @@ class AdminHandler(BaseView):
                 status=403
             )
 
+    def _pk_keys(self) -> list:
+        return [self.pk] if isinstance(self.pk, str) else list(self.pk)
+
+    def _pk_values(self, objid: Any) -> tuple:
+        """PK values (converted by the Model) of an id given as scalar, list or dict."""
+        keys = self._pk_keys()
+        if isinstance(objid, dict):
+            values = [objid[k] for k in keys]
+        elif isinstance(objid, (list, tuple)):
+            if len(objid) != len(keys):
+                raise ValueError(
+                    f"Invalid Number of elements for PK: {keys}, {objid!r}"
+                )
+            values = objid
+        else:
+            values = [objid]
+        return tuple(
+            coerce_value(self.model.__columns__[k], v) for k, v in zip(keys, values)
+        )
+
+    async def _bulk_delete(self, job: Job, jobs: JobManager, db, ids: list):
+        keys = self._pk_keys()
+        where = ' AND '.join(f"{k} = ${i}" for i, k in enumerate(keys, 1))
+        sql = f"DELETE FROM {model_table(self.model)} WHERE {where}"
+        deleted = 0
+        for chunk in jobs.chunks(ids):
+            async with await db.acquire() as conn:
+                _, error = await conn.execute_many(sql, chunk)
+            if not error:
+                deleted += len(chunk)
+            await jobs.progress(job, len(chunk), [{"error": str(error)}] if error else None)
+        return {"deleted": deleted}
+
+    async def _bulk_update(self, job: Job, jobs: JobManager, db, ids: list, data: dict):
+        keys = self._pk_keys()
+        columns = list(data.keys())
+        values = tuple(data.values())
+        sets = ', '.join(f"{c} = ${i}" for i, c in enumerate(columns, 1))
+        where = ' AND '.join(
+            f"{k} = ${i}" for i, k in enumerate(keys, len(columns) + 1)
+        )
+        sql = f"UPDATE {model_table(self.model)} SET {sets} WHERE {where}"
+        updated = 0
+        for chunk in jobs.chunks(ids):
+            args = [values + objid for objid in chunk]
+            async with await db.acquire() as conn:
+                _, error = await conn.execute_many(sql, args)
+            if not error:
+                updated += len(chunk)
+            await jobs.progress(job, len(chunk), [{"error": str(error)}] if error else None)
+        return {"updated": updated}
+
+    async def _bulk_import(self, job: Job, jobs: JobManager, db, rows: list):
+        inserted = 0
+        for chunk in jobs.chunks(rows):
+            # model validation is CPU-bound, made on the Process Pool:
+            valid, errors = await jobs.run_cpu(
+                validate_rows, self.model, self._columns, chunk
+            )
+            # rows with the same columns are inserted together:
+            groups = {}
+            for row in valid:
+                groups.setdefault(tuple(row.keys()), []).append(tuple(row.values()))
+            async with await db.acquire() as conn:
+                for columns, args in groups.items():
+                    placeholders = ', '.join(f"${i}" for i in range(1, len(columns) + 1))
+                    sql = (
+                        f"INSERT INTO {model_table(self.model)} ({', '.join(columns)}) "
+                        f"VALUES ({placeholders})"
+                    )
+                    _, error = await conn.execute_many(sql, args)
+                    if error:
+                        errors.append({"error": str(error)})
+                    else:
+                        inserted += len(args)
+            await jobs.progress(job, len(chunk), errors)
+        return {"inserted": inserted}
+
+    async def _bulk_audited(
+        self,
+        job: Job,
+        session: SessionData,
+        action: str,
+        ids: Union[list, None],
+        changes: Union[dict, None],
+        fn,
+        *args
+    ):
+        """Run a bulk operation, audited on completion with its result."""
+        result = await fn(job, *args)
+        after = {"job": job.id, **result, "errors": len(job.errors)}
+        if changes:
+            after['data'] = changes
+        self.audit(
+            session,
+            f"bulk_{action}",
+            ids if ids is not None else {"job": job.id},
+            after=after
+        )
+        return result
+
+    async def bulk(self, session: SessionData):
+        """Run a bulk operation as a background Job.
+
+        Payload:
+            {"action": "delete", "ids": [...]}
+            {"action": "update", "ids": [...], "data": {...}}
+            {"action": "import", "rows": [{...}, ...]}
+        """
+        try:
+            jobs = self.request.app['admin_jobs']
+        except KeyError:
+            return self.error(
+                reason="Admin Jobs are not enabled.",
+                status=501
+            )
+        try:
+            data = await self.json_data()
+            action = data['action']
+        except (TypeError, ValueError, KeyError, AuthException):
+            return self.error(
+                reason=f"Invalid {self.name} Bulk Data",
+                status=406
+            )
+        db = self.request.app['authdb']
+        try:
+            if action == 'delete':
+                if self.can_delete is False:
+                    return self.error(
+                        reason="DELETE options are not allowed.",
+                        status=405
+                    )
+                ids = [self._pk_values(objid) for objid in data['ids']]
+                fn, args, total = self._bulk_delete, (ids, ), len(ids)
+            elif action == 'update':
+                if self.can_update is False:
+                    return self.error(
+                        reason="UPDATE options are not allowed.",
+                        status=405
+                    )
+                if invalid := [k for k in data['data'] if k not in self._columns]:
+                    raise ValueError(f"Invalid columns for {self.name}: {invalid!r}")
+                changes = coerce_values(self.model, data['data'])
+                ids = [self._pk_values(objid) for objid in data['ids']]
+                fn, args, total = self._bulk_update, (ids, changes), len(ids)
+            elif action == 'import':
+                if self.can_create is False:
+                    return self.error(
+                        reason="INSERT options are not allowed.",
+                        status=405
+                    )
+                rows = data['rows']
+                ids = None
+                fn, args, total = self._bulk_import, (rows, ), len(rows)
+            else:
+                raise ValueError(f"Invalid Bulk action: {action}")
+        except (KeyError, TypeError, ValueError) as ex:
+            return self.error(
+                reason=f"Invalid {self.name} Bulk Data: {ex}",
+                status=406
+            )
+        job = jobs.submit(
+            f"{self.name}:{action}",
+            self._bulk_audited,
+            session,
+            action,
+            ids,
+            data.get('data', None),
+            fn,
+            jobs,
+            db,
+            *args,
+            total=total,
+            user=session_user(session)
+        )
+        return self.json_response(
+            job.to_dict(),
+            status=202,
+            headers={
+                "Location": f"{self.uri_prefix}/:jobs/{job.id}"
+            }
+        )
+
     async def post(self):
         """ Create or Update a Client."""
         session = await self.validate()
+        ### get session Data:
+        params = self.match_parameters()
+        if params.get('meta', None) == ':bulk':
+            return await self.bulk(session)
         if self.can_update is False or self.can_create is False:
             raise self.error(
                 reason="UPDATE/INSERT options are not allowed.",
                 status=405
             )
-        ### get session Data:
-        params = self.match_parameters()
         try:
             data = await self.json_data()
         except (TypeError, ValueError, AuthException):
@@ -433,14 +913,17 @@ class AdminHandler(BaseView):
                     "error": f"{self.name} was not Found"
                 }
                 try:
-                    result = await self.model.get(**args)
+                    async with self.tracked('get', args):
+                        result = await self.model.get(**args)
                 except NoDataFound:
                     # create new Record
                     result = None
                 if not result:
                     try:
                         resultset = self.model(**data) # pylint: disable=E1102
-                        result = await resultset.insert()
+                        async with self.tracked('insert', values=data):
+                            result = await resultset.insert()
+                        self.audit(session, 'post', args, after=result)
                         return self.json_response(result, status=201)
                     except ValidationError as ex:
                         error = {
@@ -451,11 +934,15 @@ class AdminHandler(BaseView):
                             reason=error,
                             status=406
                         )
+                # only copied if Audit is enabled (fields are changed below):
+                before = self.audit_snapshot(result)
                 ## saved with new changes:
                 for key, val in data.items():
                     if key in result.get_fields():
                         result.set(key, val)
-                data = await result.update()
+                async with self.tracked('update', args, values=data):
+                    data = await result.update()
+                self.audit(session, 'post', args, before=before, after=data)
                 return self.json_response(data, status=202)
         else:
             # create a new client based on data:
@@ -463,7 +950,9 @@ class AdminHandler(BaseView):
                 resultset = self.model(**data) # pylint: disable=E1102
                 async with await db.acquire() as conn:
                     resultset.Meta.connection = conn
-                    result = await resultset.insert() # TODO: migrate to use save()
+                    async with self.tracked('insert', values=data):
+                        result = await resultset.insert() # TODO: migrate to use save()
+                    self.audit(session, 'post', None, after=result)
                     return self.json_response(result, status=201)
             except ValidationError as ex:
                 error = {
@@ -536,14 +1025,17 @@ class AdminHandler(BaseView):
             async with await db.acquire() as conn:
                 self.model.Meta.connection = conn
                 # look for this client, after, save changes
-                result = await self.model.get(**args)
+                async with self.tracked('get', args):
+                    result = await self.model.get(**args)
                 if not result:
                     self.error(
                         reason=f"{self.name} was Not Found",
                         status=204
                     )
                 # Delete them this Client
-                data = await result.delete()
+                async with self.tracked('delete', args):
+                    data = await result.delete()
+                self.audit(session, 'delete', args, before=result)
                 return self.json_response(data, status=202)
         else:
             self.error(
@@ -0,0 +1,317 @@
+"""
+Admin Jobs: background runner for long Admin operations.
+"""
+import asyncio
+import logging
+import sys
+import uuid
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, datetime
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Optional, Union
+import orjson
+from aiohttp import web
+from datamodel import BaseModel
+from datamodel.exceptions import ValidationError
+from datamodel.converters import (
+    to_boolean,
+    to_date,
+    to_datetime,
+    to_decimal,
+    to_float,
+    to_integer,
+    to_uuid
+)
+from .encoders import base_type
+
+
+_converters: dict = {
+    bool: to_boolean,
+    int: to_integer,
+    float: to_float,
+    Decimal: to_decimal,
+    datetime: to_datetime,
+    date: to_date,
+    uuid.UUID: to_uuid
+}
+
+
+def coerce_value(field: Any, value: Any) -> Any:
+    """Convert a JSON value into the type of a Model field.
+
+    Raises ValueError if the value cannot be converted.
+    """
+    if value is None:
+        return None
+    _type = base_type(getattr(field, 'type', None))
+    try:
+        fn = _converters[_type]
+    except (KeyError, TypeError):
+        return value
+    if isinstance(value, _type) and not (_type is int and isinstance(value, bool)):
+        return value
+    try:
+        result = fn(value)
+    except (TypeError, ValueError, ArithmeticError) as ex:
+        raise ValueError(
+            f"Invalid value for {getattr(field, 'name', _type)}: {value!r}"
+        ) from ex
+    if result is None or (_type is int and isinstance(result, bool)):
+        # converters returning None on invalid values:
+        raise ValueError(
+            f"Invalid value for {getattr(field, 'name', _type)}: {value!r}"
+        )
+    return result
+
+
+def coerce_values(model: BaseModel, data: dict) -> dict:
+    """Convert the JSON values of ``data`` by the fields of a Model."""
+    return {
+        key: coerce_value(model.__columns__[key], value)
+        for key, value in data.items()
+    }
+
+
+def validate_rows(model: BaseModel, columns: list, rows: list) -> tuple:
+    """Validate a chunk of rows against a Model (runs on the Process Pool).
+
+    Returns the valid rows (only the columns given on every row, converted
+    by the Model) and the list of errors.
+    """
+    valid = []
+    errors = []
+    for idx, row in enumerate(rows):
+        try:
+            obj = model(**row)  # pylint: disable=E1102
+            valid.append(
+                {k: getattr(obj, k) for k in row if k in columns}
+            )
+        except (ValidationError, TypeError, ValueError, AttributeError) as ex:
+            errors.append({"row": idx, "error": str(ex)})
+    return valid, errors
+
+
+class Job:
+    """Job.
+
+    Status and progress of a long Admin operation.
+    """
+    def __init__(self, name: str, total: int = 0, user: Any = None) -> None:
+        self.id: str = uuid.uuid4().hex
+        self.name = name
+        self.user = user
+        self.status: str = 'pending'
+        self.total = total
+        self.done: int = 0
+        self.errors: list = []
+        self.result: Any = None
+        self.created_at = datetime.utcnow()
+        self.updated_at = self.created_at
+        self.task: Optional[asyncio.Task] = None
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Job':
+        """Job (without Task) from its persisted status."""
+        job = cls(data['name'], total=data.get('total', 0), user=data.get('user', None))
+        job.id = data['id']
+        for attr in ('status', 'done', 'errors', 'result'):
+            if attr in data:
+                setattr(job, attr, data[attr])
+        for attr in ('created_at', 'updated_at'):
+            if value := data.get(attr, None):
+                setattr(job, attr, datetime.fromisoformat(value))
+        return job
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ('done', 'failed', 'cancelled')
+
+    def to_dict(self) -> dict:
+        return {
+            "id": self.id,
+            "name": self.name,
+            "user": self.user,
+            "status": self.status,
+            "total": self.total,
+            "done": self.done,
+            "progress": round(self.done / self.total * 100, 2) if self.total else None,
+            "errors": self.errors,
+            "result": self.result,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at
+        }
+
+
+class JobStore:
+    """JobStore.
+
+    Keeps the Jobs in memory and, if a directory is given, persists
+    every progress update as a JSON file (written on the executor);
+    ``fetch`` and ``fetch_all`` fall back to the persisted Jobs, to
+    follow the Jobs of other workers (or of a previous run).
+    """
+    def __init__(self, path: Union[str, Path] = None, max_jobs: int = 1000) -> None:
+        self.path = Path(path).resolve() if path else None
+        self.max_jobs = max_jobs
+        self._jobs: dict = {}
+        self.logger = logging.getLogger('Navigator.Admin.Jobs')
+
+    def add(self, job: Job) -> None:
+        if len(self._jobs) >= self.max_jobs:
+            # forget the oldest finished jobs:
+            for jid in [j.id for j in self._jobs.values() if j.finished]:
+                del self._jobs[jid]
+                if len(self._jobs) < self.max_jobs:
+                    break
+        self._jobs[job.id] = job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        return self._jobs.get(job_id, None)
+
+    def all(self) -> list:
+        return list(self._jobs.values())
+
+    def _read(self, job_id: str) -> Optional[Job]:
+        try:
+            return Job.from_dict(orjson.loads((self.path / f"{job_id}.json").read_bytes()))
+        except FileNotFoundError:
+            return None
+        except (OSError, orjson.JSONDecodeError, KeyError, TypeError, ValueError) as ex:
+            self.logger.warning(f"Unable to read the Job {job_id}: {ex}")
+            return None
+
+    def _read_all(self) -> list:
+        if not self.path.is_dir():
+            return []
+        jobs = (self._read(file.stem) for file in self.path.glob('*.json'))
+        return [job for job in jobs if job is not None]
+
+    async def fetch(self, job_id: str) -> Optional[Job]:
+        """Job in memory, or the persisted one (if a directory is given)."""
+        if job := self.get(job_id):
+            return job
+        # job ids are hex uuids (never a path):
+        if self.path is None or not job_id.isalnum():
+            return None
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._read, job_id)
+
+    async def fetch_all(self) -> list:
+        """Jobs in memory plus the persisted ones, newest first."""
+        jobs = {job.id: job for job in self.all()}
+        if self.path is not None:
+            loop = asyncio.get_running_loop()
+            for job in await loop.run_in_executor(None, self._read_all):
+                jobs.setdefault(job.id, job)
+        return sorted(jobs.values(), key=lambda j: j.created_at, reverse=True)
+
+    def _write(self, job_id: str, data: bytes) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        (self.path / f"{job_id}.json").write_bytes(data)
+
+    async def save(self, job: Job) -> None:
+        job.updated_at = datetime.utcnow()
+        if self.path is None:
+            return
+        data = orjson.dumps(job.to_dict(), default=str)
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self._write, job.id, data)
+
+
+class JobManager:
+    """JobManager.
+
+    Run long Admin operations as background asyncio Tasks (bounded by
+    ``max_jobs`` concurrent jobs), CPU-bound steps are sent to a
+    Process Pool with ``run_cpu``.
+    """
+    def __init__(
+        self,
+        max_jobs: int = 4,
+        max_workers: int = 2,
+        chunk_size: int = 500,
+        store: JobStore = None
+    ) -> None:
+        self.max_jobs = max_jobs
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self.store = store if store is not None else JobStore()
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self.logger = logging.getLogger('Navigator.Admin.Jobs')
+
+    async def start(self, app: web.Application) -> None:
+        self._semaphore = asyncio.Semaphore(self.max_jobs)
+        self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+
+    async def stop(self) -> None:
+        tasks = [j.task for j in self.store.all() if j.task and not j.task.done()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        if self._pool is not None:
+            if sys.version_info >= (3, 9):
+                self._pool.shutdown(wait=False, cancel_futures=True)
+            else:
+                self._pool.shutdown(wait=False)
+            self._pool = None
+
+    async def run_cpu(self, fn: Callable, *args) -> Any:
+        """Run a CPU-bound (and picklable) function on the Process Pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool, fn, *args)
+
+    def submit(
+        self,
+        name: str,
+        fn: Callable[..., Awaitable],
+        *args,
+        total: int = 0,
+        user: Any = None
+    ) -> Job:
+        """Schedule ``fn(job, *args)`` as a background Job."""
+        job = Job(name, total=total, user=user)
+        self.store.add(job)
+        job.task = asyncio.create_task(
+            self._run(job, fn, *args), name=f"admin_job_{job.id}"
+        )
+        return job
+
+    async def progress(self, job: Job, done: int, errors: list = None) -> None:
+        """Advance a Job by a processed chunk and persist its progress.
+
+        ``done`` counts the processed items, successful or not.
+        """
+        job.done += done
+        if errors:
+            job.errors.extend(errors)
+        await self.store.save(job)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        job = self.store.get(job_id)
+        if job is not None and job.task and not job.task.done():
+            job.task.cancel()
+        return job
+
+    def chunks(self, items: list) -> list:
+        return [
+            items[i:i + self.chunk_size] for i in range(0, len(items), self.chunk_size)
+        ]
+
+    async def _run(self, job: Job, fn: Callable, *args) -> None:
+        try:
+            async with self._semaphore:
+                job.status = 'running'
+                await self.store.save(job)
+                job.result = await fn(job, *args)
+                job.status = 'done'
+        except asyncio.CancelledError:
+            job.status = 'cancelled'
+        except Exception as ex:  # pylint: disable=W0703
+            self.logger.exception(f"Admin Job {job.name}:{job.id} failed: {ex}")
+            job.status = 'failed'
+            job.errors.append({"error": str(ex)})
+        finally:
+            await self.store.save(job)
@@ -0,0 +1,120 @@
+"""
+Related Loader: batched resolution of Foreign Keys for Admin Handlers.
+"""
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import Any, Union
+from datamodel import BaseModel
+
+
+def model_table(model: BaseModel) -> str:
+    """Return the fully qualified table name of a Model."""
+    table = model.Meta.name if model.Meta.name else model.__name__.lower()
+    schema = getattr(model.Meta, 'schema', None)
+    return f"{schema}.{table}" if schema else table
+
+
+def model_pk(model: BaseModel) -> list:
+    """Return the list of Primary Key columns of a Model."""
+    return [
+        name for name, field in model.__columns__.items()
+        if getattr(field, 'primary_key', False) is True
+    ]
+
+
+class RelatedLoader:
+    """RelatedLoader.
+
+    Per-request dataloader for Foreign Keys: collects the FK values of
+    a page of rows and resolves every related Model with only one
+    batched query (``WHERE column = ANY($1)``), caching the results
+    for the rest of the request.
+    """
+    def __init__(self, connection: Any) -> None:
+        self._connection = connection
+        # {(model, column): {value: record}}
+        self._cache: dict = defaultdict(dict)
+
+    @staticmethod
+    def relations(handler: Any) -> dict:
+        """Relations of a Handler Model as {field: (model, column)}.
+
+        Declared in the Handler as ``related = {'field': Model}`` or
+        ``related = {'field': (Model, 'column')}``; otherwise detected
+        from the Model fields annotated with another Model.
+        """
+        result = {}
+        for name, field in handler.model.__columns__.items():
+            _type = getattr(field, 'type', None)
+            if isinstance(_type, type) and issubclass(_type, BaseModel):
+                pk = model_pk(_type)
+                # without a single-column PK, requires a declared column:
+                if len(pk) == 1:
+                    result[name] = (_type, pk[0])
+        for name, rel in handler.related.items():
+            if isinstance(rel, tuple):
+                model, column = rel
+            else:
+                model = rel
+                pk = model_pk(model)
+                if len(pk) != 1:
+                    raise ValueError(
+                        f"{model.__name__} has no single-column PK, declare "
+                        f"the related column as {{'{name}': ({model.__name__}, 'column')}}"
+                    )
+                column = pk[0]
+            result[name] = (model, column)
+        return result
+
+    @staticmethod
+    def fk_value(value: Any, column: str) -> Any:
+        if isinstance(value, BaseModel):
+            return getattr(value, column, None)
+        elif isinstance(value, dict):
+            return value.get(column, None)
+        return value
+
+    async def load(self, model: BaseModel, column: str, values: Iterable) -> dict:
+        """Resolve a set of values of a related Model, only the values
+        not already cached on this request are queried."""
+        cache = self._cache[(model, column)]
+        missing = list({v for v in values if v is not None and v not in cache})
+        if missing:
+            sql = f"SELECT * FROM {model_table(model)} WHERE {column} = ANY($1)"
+            result = await self._connection.fetch_all(sql, missing)
+            for row in result or []:
+                cache[row[column]] = dict(row)
+            for value in missing:
+                # avoid querying again not-found values:
+                cache.setdefault(value, None)
+        return cache
+
+    async def expand(
+        self,
+        rows: Union[list, dict],
+        fields: list,
+        relations: dict
+    ) -> Union[list, dict]:
+        """Add the related records of ``fields`` into every row
+        as ``row['_expanded'][field]``.
+        """
+        single = isinstance(rows, dict)
+        if single:
+            rows = [rows]
+        # group values by related model, one query per model:
+        values = defaultdict(set)
+        for field in fields:
+            model, column = relations[field]
+            for row in rows:
+                value = self.fk_value(row.get(field, None), column)
+                if value is not None:
+                    values[(model, column)].add(value)
+        for (model, column), vals in values.items():
+            await self.load(model, column, vals)
+        for row in rows:
+            expanded = row.setdefault('_expanded', {})
+            for field in fields:
+                model, column = relations[field]
+                value = self.fk_value(row.get(field, None), column)
+                expanded[field] = self._cache[(model, column)].get(value, None)
+        return rows[0] if single else rows
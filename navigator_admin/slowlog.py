@@ -0,0 +1,156 @@
+"""
+Slow Query Log: timing and sampled EXPLAIN of Admin queries.
+"""
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from datetime import datetime
+from typing import Optional
+from aiohttp import web
+
+
+@asynccontextmanager
+async def untracked():
+    """No-op replacement of ``SlowQueryLog.track``."""
+    yield
+
+
+class SlowQueryLog:
+    """SlowQueryLog.
+
+    Records the queries slower than ``threshold`` (in milliseconds) with
+    statement, parameters and caller into a bounded ring buffer; the
+    ``EXPLAIN`` of a sample (``explain_rate``) of the slow SELECT statements
+    is captured on background Tasks, with a new connection of the same
+    pool (``db_name`` of the query, or the default one) of the application.
+
+    Values of the ``sensitive`` columns (plus the ``sensitive`` columns of
+    every Handler) are redacted from the recorded parameters.
+    """
+    redacted: str = '******'
+
+    def __init__(
+        self,
+        threshold: float = 500,
+        max_entries: int = 200,
+        explain_rate: float = 0.2,
+        max_explains: int = 2,
+        db_name: str = 'authdb',
+        sensitive: tuple = ('password', 'secret', 'token', 'api_key')
+    ) -> None:
+        self.threshold = threshold
+        self.sensitive = frozenset(sensitive)
+        self.explain_rate = explain_rate
+        self.max_explains = max_explains
+        self.db_name = db_name
+        self._entries: deque = deque(maxlen=max_entries)
+        self._tasks: set = set()
+        self._app = None
+        self.logger = logging.getLogger('Navigator.Admin.SlowLog')
+
+    async def start(self, app: web.Application) -> None:
+        self._app = app
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    def entries(self) -> list:
+        """Slow queries, newest first."""
+        return list(reversed(self._entries))
+
+    @asynccontextmanager
+    async def track(
+        self,
+        handler: str,
+        verb: str,
+        operation: str,
+        statement: str,
+        params: Optional[list] = None,
+        columns: Optional[list] = None,
+        sensitive: Optional[list] = None,
+        db_name: Optional[str] = None
+    ):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = (time.perf_counter() - started) * 1000
+            if duration >= self.threshold:
+                self.add(
+                    handler, verb, operation, statement, params, duration,
+                    columns=columns, sensitive=sensitive, db_name=db_name
+                )
+
+    def redact(
+        self,
+        params: Optional[list],
+        columns: Optional[list] = None,
+        sensitive: Optional[list] = None
+    ) -> Optional[list]:
+        """Parameters with the values of sensitive columns redacted."""
+        if not params:
+            return params
+        if columns is None:
+            # unknown columns, nothing can be shown:
+            return [self.redacted for _ in params]
+        hidden = self.sensitive.union(sensitive or ())
+        return [
+            self.redacted if column in hidden else value
+            for column, value in zip(columns, params)
+        ]
+
+    def add(
+        self,
+        handler: str,
+        verb: str,
+        operation: str,
+        statement: str,
+        params: Optional[list],
+        duration: float,
+        columns: Optional[list] = None,
+        sensitive: Optional[list] = None,
+        db_name: Optional[str] = None
+    ) -> dict:
+        entry = {
+            "ts": datetime.now(),
+            "db": db_name or self.db_name,
+            "handler": handler,
+            "verb": verb,
+            "operation": operation,
+            "statement": statement,
+            "params": self.redact(params, columns, sensitive),
+            "duration": round(duration, 2),
+            "plan": None
+        }
+        self._entries.append(entry)
+        self.logger.warning(
+            f"Slow Query ({entry['duration']} ms) on {handler}.{verb}: {statement}"
+        )
+        if (
+            self._app is not None
+            and statement.lstrip().upper().startswith('SELECT')
+            and len(self._tasks) < self.max_explains
+            and random.random() < self.explain_rate
+        ):
+            # EXPLAIN with the real (not redacted) parameters:
+            task = asyncio.create_task(self._explain(entry, params))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return entry
+
+    async def _explain(self, entry: dict, params: Optional[list] = None) -> None:
+        try:
+            # on the same pool that made the query:
+            async with await self._app[entry['db']].acquire() as conn:
+                rows = await conn.fetch_all(
+                    f"EXPLAIN {entry['statement']}", *(params or [])
+                )
+            entry['plan'] = '\n'.join(r[0] for r in rows or [])
+        except Exception as ex:  # pylint: disable=W0703
+            self.logger.error(f"Unable to EXPLAIN {entry['statement']}: {ex}")
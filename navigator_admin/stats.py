@@ -0,0 +1,155 @@
+"""
+Admin Stats: precomputed per-model statistics for the Admin Dashboard.
+"""
+import asyncio
+import logging
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Optional
+from aiohttp import web
+from datamodel import BaseModel
+from .related import model_table
+
+
+class StatsRefresher:
+    """StatsRefresher.
+
+    Background Task that computes (every ``interval`` seconds) the row
+    count, the recent changes (inside ``window``) and the growth of every
+    registered Model, and keeps them cached for the Dashboard.
+
+    On incremental mode, the row count is the planner estimate and only the
+    rows changed after the last ``watermark`` column value are scanned; the
+    growth is only computed between counts of the same source (``count`` or
+    ``estimate``).
+    """
+    def __init__(
+        self,
+        interval: int = 300,
+        window: timedelta = timedelta(days=1),
+        incremental: bool = False,
+        watermark: str = 'updated_at',
+        db_name: str = 'authdb'
+    ) -> None:
+        self.interval = interval
+        self.window = window
+        self.incremental = incremental
+        self.watermark = watermark
+        self.db_name = db_name
+        self._models: dict = {}
+        self._stats: dict = {}
+        self._snapshot: list = []
+        # incremental state: {name: last watermark} and {name: deque((ts, changes))}
+        self._watermarks: dict = {}
+        self._changes: dict = {}
+        self._db = None
+        self._task: Optional[asyncio.Task] = None
+        self.logger = logging.getLogger('Navigator.Admin.Stats')
+
+    def register(self, name: str, model: BaseModel) -> None:
+        self._models[name] = model
+
+    def reset(self, name: str = None) -> None:
+        """Forget the incremental state (all, or of a Model)."""
+        names = [name] if name else list(self._models)
+        for n in names:
+            self._watermarks.pop(n, None)
+            self._changes.pop(n, None)
+
+    def snapshot(self) -> list:
+        """Cached statistics of all Models, computed by the last refresh."""
+        return self._snapshot
+
+    def get(self, name: str) -> Optional[dict]:
+        return self._stats.get(name, None)
+
+    async def start(self, app: web.Application) -> None:
+        self._db = app[self.db_name]
+        self._task = asyncio.create_task(self._worker(), name='admin_stats')
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _worker(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception as ex:  # pylint: disable=W0703
+                # ex: database unavailable, retried on next interval
+                self.logger.error(f"Unable to refresh Admin stats: {ex}")
+            await asyncio.sleep(self.interval)
+
+    async def refresh(self) -> None:
+        now = datetime.now()
+        async with await self._db.acquire() as conn:
+            for name, model in self._models.items():
+                try:
+                    if self.incremental and name in self._watermarks:
+                        rows, recent, source = await self._incremental(conn, name, model, now)
+                    else:
+                        rows, recent, source = await self._full(conn, name, model, now)
+                except Exception as ex:  # pylint: disable=W0703
+                    self.logger.error(f"Unable to refresh stats of {name}: {ex}")
+                    continue
+                last = self._stats.get(name, {})
+                # an estimate and an exact count are not comparable:
+                previous = last.get('rows', None) if last.get('source', None) == source else None
+                growth = rows - previous if previous is not None else 0
+                self._stats[name] = {
+                    "name": name,
+                    "rows": rows,
+                    "source": source,
+                    "recent": recent,
+                    "growth": growth,
+                    "growth_pct": round(growth / previous * 100, 2) if previous else 0,
+                    "refreshed_at": now
+                }
+        self._snapshot = [self._stats[n] for n in self._models if n in self._stats]
+
+    def _has_watermark(self, model: BaseModel) -> bool:
+        return self.watermark in model.__columns__
+
+    async def _full(self, conn, name: str, model: BaseModel, now: datetime) -> tuple:
+        table = model_table(model)
+        if not self._has_watermark(model):
+            rows = await conn.fetchval(f"SELECT count(*) FROM {table}")
+            return rows, None, 'count'
+        row = await conn.fetch_one(
+            f"SELECT count(*) AS rows, "
+            f"count(*) FILTER (WHERE {self.watermark} >= $1) AS recent, "
+            f"max({self.watermark}) AS watermark FROM {table}",
+            now - self.window
+        )
+        if self.incremental and row['watermark'] is not None:
+            self._watermarks[name] = row['watermark']
+            self._changes[name] = deque([(now, row['recent'])])
+        return row['rows'], row['recent'], 'count'
+
+    async def _incremental(self, conn, name: str, model: BaseModel, now: datetime) -> tuple:
+        table = model_table(model)
+        rows = await conn.fetchval(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = $1::text::regclass",
+            table
+        )
+        if rows is None or rows < 0:
+            # reltuples is -1 on tables never analyzed:
+            return await self._full(conn, name, model, now)
+        row = await conn.fetch_one(
+            f"SELECT count(*) AS changes, max({self.watermark}) AS watermark "
+            f"FROM {table} WHERE {self.watermark} > $1",
+            self._watermarks[name]
+        )
+        if row['watermark'] is not None:
+            self._watermarks[name] = row['watermark']
+        changes = self._changes[name]
+        changes.append((now, row['changes']))
+        while changes and changes[0][0] < now - self.window:
+            changes.popleft()
+        return rows, sum(c for _, c in changes), 'estimate'
@@ -0,0 +1,159 @@
+"""
+Login Throttle: admission control for the Admin Login.
+"""
+import asyncio
+import math
+import sys
+import time
+from collections import OrderedDict
+from typing import Optional
+from aiohttp import web
+
+
+class TokenBucket:
+    """TokenBucket.
+
+    ``burst`` tokens refilled at ``rate`` tokens per second.
+    """
+    __slots__ = ('rate', 'burst', 'tokens', 'updated')
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+
+    def consume(self, tokens: float = 1.0) -> float:
+        """Consume tokens, returns 0 if allowed or the seconds to wait."""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+        if self.tokens >= tokens:
+            self.tokens -= tokens
+            return 0
+        return (tokens - self.tokens) / self.rate
+
+    def penalize(self, tokens: float = 1.0) -> None:
+        self.tokens -= tokens
+
+
+class BucketMap:
+    """Token Buckets by key, bounded in size (least recently used are evicted)."""
+    def __init__(self, rate: float, burst: int, max_keys: int = 10000) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.max_keys = max_keys
+        self._buckets: OrderedDict = OrderedDict()
+
+    def get(self, key: str) -> TokenBucket:
+        try:
+            bucket = self._buckets[key]
+            self._buckets.move_to_end(key)
+        except KeyError:
+            bucket = self._buckets[key] = TokenBucket(self.rate, self.burst)
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return bucket
+
+
+class LoginThrottle:
+    """LoginThrottle.
+
+    Admission layer for the Admin Login: per-IP and per-username Token
+    Buckets (checked before any credential work) and a global limit of
+    concurrent authentications; failed logins consume ``penalty`` extra
+    tokens of the username.
+
+    Behind a reverse proxy, ``forwarded_header`` must be set (ex:
+    ``X-Forwarded-For``), otherwise every client shares the bucket of the
+    proxy address.
+    """
+    def __init__(
+        self,
+        ip_rate: float = 1.0,
+        ip_burst: int = 10,
+        user_rate: float = 0.2,
+        user_burst: int = 5,
+        penalty: float = 1.0,
+        max_concurrent: int = 4,
+        queue_timeout: float = 1.0,
+        max_keys: int = 10000,
+        forwarded_header: str = None
+    ) -> None:
+        self.ips = BucketMap(ip_rate, ip_burst, max_keys)
+        self.users = BucketMap(user_rate, user_burst, max_keys)
+        self.penalty = penalty
+        self.max_concurrent = max_concurrent
+        self.queue_timeout = queue_timeout
+        # trusted header with the client address (ex: X-Forwarded-For)
+        self.forwarded_header = forwarded_header
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def client_ip(self, request: web.Request) -> str:
+        if self.forwarded_header:
+            if forwarded := request.headers.get(self.forwarded_header, None):
+                return forwarded.split(',')[0].strip()
+        return request.remote
+
+    def check(self, ip: str, username: Optional[str] = None) -> float:
+        """Fast path: returns 0 if allowed or the seconds to Retry-After."""
+        wait = self.ips.get(ip).consume()
+        if wait:
+            return wait
+        if username:
+            return self.users.get(str(username).lower()).consume()
+        return 0
+
+    def failed(self, username: Optional[str] = None) -> None:
+        if username:
+            self.users.get(str(username).lower()).penalize(self.penalty)
+
+    def reject(self, wait: float) -> web.HTTPTooManyRequests:
+        return web.HTTPTooManyRequests(
+            reason="Too many login attempts, try again later.",
+            headers={
+                "Retry-After": str(math.ceil(wait))
+            }
+        )
+
+    def busy(self) -> web.HTTPServiceUnavailable:
+        return web.HTTPServiceUnavailable(
+            reason="Login service is busy, try again later.",
+            headers={
+                "Retry-After": "1"
+            }
+        )
+
+    async def acquire(self) -> None:
+        """Take an authentication slot, reject if none is free in time."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent)
+        if sys.version_info >= (3, 11):
+            try:
+                async with asyncio.timeout(self.queue_timeout):
+                    await self._semaphore.acquire()
+            except TimeoutError as ex:
+                raise self.busy() from ex
+            return
+        # wait_for can lose a slot acquired just after the timeout:
+        task = asyncio.ensure_future(self._semaphore.acquire())
+        try:
+            done, _ = await asyncio.wait({task}, timeout=self.queue_timeout)
+        except asyncio.CancelledError:
+            await self._cancel(task)
+            raise
+        if not done:
+            await self._cancel(task)
+            raise self.busy()
+
+    async def _cancel(self, task: asyncio.Future) -> None:
+        """Cancel a pending acquire, returning the slot if it was taken."""
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            return
+        self._semaphore.release()
+
+    def release(self) -> None:
+        self._semaphore.release()
@@ -98,6 +98,12 @@ setup(
         "pendulum==2.1.2",
         "inflector==3.0.1"
     ],
+    extras_require={
+        "compression": [
+            "brotli",
+            "zstandard"
+        ]
+    },
     tests_require=[
         'pytest>=6.0.0',
         'pytest-asyncio==0.19.0',
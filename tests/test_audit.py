@@ -0,0 +1,66 @@
+"""Tests for the asynchronous Audit Log."""
+import orjson
+import pytest
+from navigator_admin.audit import AuditLog, AuditSink, JSONLinesSink, audit_diff
+
+
+class MemorySink(AuditSink):
+    def __init__(self) -> None:
+        self.batches = []
+        self.closed = False
+
+    async def write(self, records: list) -> None:
+        self.batches.append(records)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def test_audit_diff():
+    before = {"name": "a", "active": True, "removed": 1}
+    after = {"name": "b", "active": True, "added": 2}
+    assert audit_diff(before, after) == {
+        "name": ["a", "b"],
+        "removed": [1, None],
+        "added": [None, 2],
+    }
+    assert audit_diff(None, {"id": 1}) == {"id": [None, 1]}
+    assert audit_diff({"id": 1}, {"id": 1}) == {}
+
+
+@pytest.mark.asyncio
+async def test_records_are_flushed_in_batches():
+    sink = MemorySink()
+    audit = AuditLog(sink, batch_size=3, flush_interval=0.01)
+    await audit.start(None)
+    for i in range(7):
+        audit.record('admin', 'Client', {"client_id": i}, 'put', after={"client_id": i})
+    await audit.stop()
+    assert sink.closed
+    assert [len(b) for b in sink.batches] == [3, 3, 1]
+    record = sink.batches[0][0]
+    assert record['user'] == 'admin'
+    assert record['diff'] == {"client_id": [None, 0]}
+    assert 'before' not in record and 'after' not in record
+
+
+@pytest.mark.asyncio
+async def test_full_queue_drops_records():
+    audit = AuditLog(MemorySink(), max_size=2)
+    audit.record('admin', 'Client', 1, 'delete')
+    assert audit.dropped == 1  # not started
+    await audit.start(None)
+    audit._task.cancel()  # nobody consumes the queue
+    for i in range(3):
+        audit.record('admin', 'Client', i, 'delete')
+    assert audit.dropped == 2
+
+
+@pytest.mark.asyncio
+async def test_jsonlines_sink(tmp_path):
+    filename = tmp_path / 'audit' / 'log.jsonl'
+    sink = JSONLinesSink(filename)
+    await sink.open(None)
+    await sink.write([{"user": "admin", "pk": 1}, {"user": "other", "pk": 2}])
+    lines = filename.read_bytes().splitlines()
+    assert [orjson.loads(line)['pk'] for line in lines] == [1, 2]
@@ -0,0 +1,66 @@
+"""Tests for the Invalidation Bus."""
+import asyncio
+import stat
+from types import SimpleNamespace
+import pytest
+from datamodel import BaseModel, Field
+from navigator_admin.admin import AdminPanel
+from navigator_admin.bus import LocalBus, session_key
+from navigator_admin.compression import Compressor
+from navigator_admin.encoders import get_encoder
+
+
+def test_session_key_uses_only_session_id():
+    assert session_key(SimpleNamespace(session_id='abc', id=1)) == 'abc'
+    assert session_key(SimpleNamespace(identity='admin', id=1)) is None
+
+
+@pytest.mark.asyncio
+async def test_local_bus_round_trip(tmp_path):
+    path = tmp_path.joinpath('bus')
+    first = LocalBus(path)
+    second = LocalBus(path)
+    received = []
+    second.subscribe(lambda kind, key: received.append((kind, key)))
+    await first.start(None)
+    await second.start(None)
+    try:
+        assert stat.S_IMODE(path.stat().st_mode) == 0o700
+        await first.schema('Client')
+        await first.revoke_session('abc')
+        for _ in range(50):
+            if len(received) == 2:
+                break
+            await asyncio.sleep(0.01)
+        assert received == [('schema', 'Client'), ('revoke', 'abc')]
+        assert second.is_revoked('abc')
+        assert not second.is_revoked('other')
+    finally:
+        await first.stop()
+        await second.stop()
+    assert list(path.glob('*.sock')) == []
+
+
+def test_local_bus_default_path_is_namespaced():
+    assert LocalBus(namespace='app1').path != LocalBus(namespace='app2').path
+
+
+@pytest.mark.asyncio
+async def test_schema_changed_drops_model_caches():
+    class Client(BaseModel):
+        client_id: int = Field(primary_key=True)
+        name: str
+
+    panel = AdminPanel.__new__(AdminPanel)
+    panel.bus = None
+    panel.stats = None
+    panel.compression = Compressor(threshold=0, encodings=('gzip', ))
+    panel._models = {'Client': ('clients', Client)}
+    encoder = get_encoder(Client, ['client_id', 'name'])
+    assert get_encoder(Client, ['client_id', 'name']) is encoder
+    cache = panel.compression.cache
+    await cache.get(Client, 'gzip', panel.compression, lambda: b'{"schema": 1}')
+    await panel.schema_changed('Client')
+    assert get_encoder(Client, ['client_id', 'name']) is not encoder
+    body, _ = await cache.get(Client, None, panel.compression, lambda: b'{"schema": 2}')
+    assert body == b'{"schema": 2}'
@@ -0,0 +1,110 @@
+"""Tests for the negotiated compression of Admin responses."""
+import gzip
+import threading
+from types import SimpleNamespace
+import pytest
+from navigator_admin.compression import BodyCache, CompressedStream, Compressor, brotli
+
+
+def request(accept_encoding: str):
+    return SimpleNamespace(headers={"Accept-Encoding": accept_encoding})
+
+
+def test_negotiate_by_server_preference_and_quality():
+    compressor = Compressor(encodings=('gzip', ))
+    assert compressor.negotiate(request('gzip;q=0.5, br')) == 'gzip'
+    assert compressor.negotiate(request('gzip;q=0')) is None
+    assert compressor.negotiate(request('identity')) is None
+    assert compressor.negotiate(request('*')) == 'gzip'
+    assert compressor.negotiate(request('')) is None
+
+
+@pytest.mark.skipif(brotli is None, reason="brotli is not installed")
+def test_negotiate_prefers_brotli():
+    compressor = Compressor()
+    assert compressor.negotiate(request('gzip, deflate, br')) == 'br'
+    assert compressor.negotiate(request('gzip, br;q=0')) == 'gzip'
+
+
+def test_gzip_round_trip():
+    compressor = Compressor(encodings=('gzip', ))
+    data = b'{"name": "navigator"}' * 200
+    assert gzip.decompress(compressor.compress(data, 'gzip')) == data
+    stream = compressor.compressobj('gzip')
+    body = b''.join(stream.compress(data[i:i + 100]) for i in range(0, len(data), 100))
+    body += stream.flush()
+    assert gzip.decompress(body) == data
+
+
+@pytest.mark.skipif(brotli is None, reason="brotli is not installed")
+def test_brotli_round_trip():
+    compressor = Compressor()
+    data = b'{"name": "navigator"}' * 200
+    assert brotli.decompress(compressor.compress(data, 'br')) == data
+    stream = compressor.compressobj('br')
+    body = stream.compress(data) + stream.flush()
+    assert brotli.decompress(body) == data
+
+
+class FakeResponse:
+    def __init__(self) -> None:
+        self.body = b''
+        self.eof = False
+
+    async def write(self, data: bytes) -> None:
+        self.body += data
+
+    async def write_eof(self) -> None:
+        self.eof = True
+
+
+@pytest.mark.asyncio
+async def test_compressed_stream_offloads_large_chunks():
+    compressor = Compressor(executor_threshold=1000, encodings=('gzip', ))
+    gzip_stream = compressor.compressobj('gzip')
+    threads = []
+
+    class Spy:
+        def compress(self, data):
+            threads.append(threading.get_ident())
+            return gzip_stream.compress(data)
+
+        def flush(self):
+            return gzip_stream.flush()
+
+    response = FakeResponse()
+    stream = CompressedStream(response, Spy(), 1000)
+    chunks = [b'a' * 10, b'b' * 5000, b'c' * 10]
+    for chunk in chunks:
+        await stream.write(chunk)
+    await stream.write_eof()
+    assert response.eof
+    assert gzip.decompress(response.body) == b''.join(chunks)
+    loop_thread = threading.get_ident()
+    assert threads[0] == threads[2] == loop_thread
+    assert threads[1] != loop_thread
+
+
+@pytest.mark.asyncio
+async def test_body_cache():
+    compressor = Compressor(threshold=100, encodings=('gzip', ))
+    cache = BodyCache()
+    calls = []
+
+    def build():
+        calls.append(1)
+        return b'x' * 1000
+
+    body, encoding = await cache.get('schema', 'gzip', compressor, build)
+    assert encoding == 'gzip' and gzip.decompress(body) == b'x' * 1000
+    again, _ = await cache.get('schema', 'gzip', compressor, build)
+    assert again is body
+    raw, encoding = await cache.get('schema', None, compressor, build)
+    assert (raw, encoding) == (b'x' * 1000, None)
+    assert len(calls) == 1
+    cache.clear('schema')
+    await cache.get('schema', None, compressor, build)
+    assert len(calls) == 2
+    # small bodies are not compressed:
+    small, encoding = await cache.get('small', 'gzip', compressor, lambda: b'{}')
+    assert (small, encoding) == (b'{}', None)
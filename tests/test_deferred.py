@@ -0,0 +1,71 @@
+"""Tests for the deferred (heavy) columns of list reads."""
+from types import SimpleNamespace
+import pytest
+from datamodel import BaseModel, Field
+from navigator_admin.encoders import is_heavy
+from navigator_admin.handler import AdminHandler
+
+
+class Document(BaseModel):
+    document_id: int = Field(primary_key=True)
+    client_id: int
+    title: str
+    body: str = Field(db_type='text')
+    metadata: dict
+    attachment: bytes
+
+    class Meta:
+        name = 'documents'
+
+
+class Handler(AdminHandler):
+    model = Document
+    pk = 'document_id'
+    name = 'Document'
+    deferred = ['title']
+
+
+def handler(query: dict = None, defer_heavy: bool = False) -> Handler:
+    obj = Handler.__new__(Handler)
+    obj._request = SimpleNamespace(query=query or {})
+    obj._columns = list(Document.__columns__)
+    obj.defer_heavy = defer_heavy
+    return obj
+
+
+def test_is_heavy():
+    columns = Document.__columns__
+    assert [name for name in columns if is_heavy(columns[name])] == [
+        'body', 'metadata', 'attachment'
+    ]
+
+
+def test_deferred_fields():
+    assert handler().deferred_fields() == {'title'}
+    assert handler(defer_heavy=True).deferred_fields() == {
+        'title', 'body', 'metadata', 'attachment'
+    }
+
+
+def test_list_columns():
+    assert handler().list_columns() == [
+        'document_id', 'client_id', 'body', 'metadata', 'attachment'
+    ]
+    assert handler(defer_heavy=True).list_columns() == ['document_id', 'client_id']
+    # expanded fields are never deferred:
+    assert handler({"expand": "title"}, defer_heavy=True).list_columns() == [
+        'document_id', 'client_id', 'title'
+    ]
+
+
+def test_list_columns_with_fields():
+    assert handler({"fields": "title, body"}).list_columns() == ['title', 'body']
+    # expanded fields are added to the projection:
+    assert handler({"fields": "title", "expand": "client_id"}).list_columns() == [
+        'title', 'client_id'
+    ]
+    assert handler({"fields": "client_id", "expand": "client_id"}).list_columns() == [
+        'client_id'
+    ]
+    with pytest.raises(ValueError):
+        handler({"fields": "title,unknown"}).list_columns()
@@ -0,0 +1,51 @@
+"""Tests for the raw-mode Record Encoders."""
+import uuid
+from decimal import Decimal
+import orjson
+from datamodel import BaseModel, Field
+from navigator_admin.encoders import RecordEncoder, column_converter
+
+
+class Setting(BaseModel):
+    setting_id: int = Field(primary_key=True)
+    value: dict = Field(db_type='jsonb')
+    options: list
+    legacy: dict = Field(db_type='text')
+    price: Decimal
+    token: uuid.UUID
+
+    class Meta:
+        name = 'settings'
+
+
+def test_json_columns_are_not_parsed_again():
+    columns = Setting.__columns__
+    assert column_converter(columns['value']) is None
+    assert column_converter(columns['options']) is None
+    assert column_converter(columns['legacy']) is not None
+    assert column_converter(columns['setting_id']) is None
+
+
+def test_encode_rows():
+    token = uuid.uuid4()
+    encoder = RecordEncoder(
+        Setting, ['setting_id', 'value', 'options', 'legacy', 'price', 'token']
+    )
+    assert encoder.sql.startswith('SELECT setting_id, value, options')
+    record = {
+        "setting_id": 1,
+        # jsonb scalar strings, as decoded by the driver:
+        "value": "2024",
+        "options": "abc",
+        "legacy": '{"a": 1}',
+        "price": Decimal('1.5'),
+        "token": token
+    }
+    assert orjson.loads(encoder.encode([record])) == [{
+        "setting_id": 1,
+        "value": "2024",
+        "options": "abc",
+        "legacy": {"a": 1},
+        "price": 1.5,
+        "token": str(token)
+    }]
@@ -0,0 +1,111 @@
+"""Tests for the background Admin Jobs."""
+import uuid
+from datetime import date
+from types import SimpleNamespace
+from typing import Optional
+import pytest
+from datamodel import BaseModel, Field
+from navigator_admin.handler import AdminHandler
+from navigator_admin.jobs import Job, JobManager, JobStore, coerce_values
+
+
+class Account(BaseModel):
+    account_id: int = Field(primary_key=True)
+    active: bool
+    opened: Optional[date]
+    token: uuid.UUID
+    name: str
+
+
+def test_coerce_values():
+    token = '12345678-1234-1234-1234-123456789012'
+    values = coerce_values(Account, {
+        "account_id": "10",
+        "active": "false",
+        "opened": "2024-01-02",
+        "token": token,
+        "name": 2024
+    })
+    assert values == {
+        "account_id": 10,
+        "active": False,
+        "opened": date(2024, 1, 2),
+        "token": uuid.UUID(token),
+        "name": 2024
+    }
+    assert coerce_values(Account, {"opened": None}) == {"opened": None}
+
+
+@pytest.mark.parametrize('data', [
+    {"account_id": "abc"},
+    {"active": "maybe"},
+    {"token": "not-an-uuid"},
+])
+def test_coerce_invalid_values(data):
+    with pytest.raises(ValueError):
+        coerce_values(Account, data)
+
+
+def test_chunks():
+    jobs = JobManager(chunk_size=2)
+    assert jobs.chunks([1, 2, 3, 4, 5]) == [[1, 2], [3, 4], [5]]
+
+
+@pytest.mark.asyncio
+async def test_job_progress_and_user():
+    jobs = JobManager(max_workers=1, chunk_size=2)
+    await jobs.start(None)
+
+    async def work(job, items):
+        for chunk in jobs.chunks(items):
+            await jobs.progress(job, len(chunk))
+        return {"processed": job.done}
+
+    job = jobs.submit('accounts:update', work, [1, 2, 3], total=3, user='admin')
+    await job.task
+    await jobs.stop()
+    data = job.to_dict()
+    assert data['status'] == 'done'
+    assert data['user'] == 'admin'
+    assert data['progress'] == 100
+    assert data['result'] == {"processed": 3}
+
+
+@pytest.mark.asyncio
+async def test_persisted_jobs_are_found_by_other_workers(tmp_path):
+    owner = JobStore(tmp_path)
+    job = Job('accounts:import', total=10, user='admin')
+    job.done = 10
+    job.status = 'done'
+    owner.add(job)
+    await owner.save(job)
+    # another worker (or a restart) with the same directory:
+    other = JobStore(tmp_path)
+    found = await other.fetch(job.id)
+    assert (found.id, found.status, found.done, found.user) == (job.id, 'done', 10, 'admin')
+    assert found.created_at == job.created_at
+    assert [j.id for j in await other.fetch_all()] == [job.id]
+    assert await other.fetch('0' * 32) is None
+    assert await other.fetch('../jobs') is None
+    assert await JobStore().fetch(job.id) is None
+
+
+@pytest.mark.asyncio
+async def test_bulk_is_audited_on_completion():
+    records = []
+    handler = SimpleNamespace(
+        audit=lambda session, verb, pk, after=None: records.append((verb, pk, after))
+    )
+
+    async def bulk_import(job, rows):
+        assert records == []
+        return {"inserted": len(rows)}
+
+    job = Job('accounts:import', total=2)
+    result = await AdminHandler._bulk_audited(
+        handler, job, {}, 'import', None, None, bulk_import, [{}, {}]
+    )
+    assert result == {"inserted": 2}
+    assert records == [(
+        'bulk_import', {"job": job.id}, {"job": job.id, "inserted": 2, "errors": 0}
+    )]
@@ -0,0 +1,91 @@
+"""Tests for batched resolution of Foreign Keys."""
+import pytest
+from datamodel import BaseModel, Field
+from navigator_admin.related import RelatedLoader, model_pk, model_table
+
+
+class Client(BaseModel):
+    client_id: int = Field(primary_key=True)
+    client: str = Field(required=False)
+
+    class Meta:
+        name = 'clients'
+        schema = 'auth'
+
+
+class Membership(BaseModel):
+    user_id: int = Field(primary_key=True)
+    group_id: int = Field(primary_key=True)
+
+
+class Program(BaseModel):
+    program_id: int = Field(primary_key=True)
+    client_id: Client = Field(required=False)
+
+    class Meta:
+        name = 'programs'
+        schema = 'auth'
+
+
+class Handler:
+    model = Program
+    related: dict = {}
+
+
+class FakeConnection:
+    def __init__(self, rows: list) -> None:
+        self.rows = rows
+        self.queries = []
+
+    async def fetch_all(self, sql, values):
+        self.queries.append((sql, sorted(values)))
+        return [r for r in self.rows if r['client_id'] in values]
+
+
+def test_model_table_and_pk():
+    assert model_table(Client) == 'auth.clients'
+    assert model_pk(Client) == ['client_id']
+    assert model_pk(Membership) == ['user_id', 'group_id']
+
+
+def test_relations_detected_from_model():
+    relations = RelatedLoader.relations(Handler)
+    assert relations == {'client_id': (Client, 'client_id')}
+
+
+def test_relations_composite_pk_requires_column():
+    class BadHandler(Handler):
+        related = {'member': Membership}
+
+    with pytest.raises(ValueError):
+        RelatedLoader.relations(BadHandler)
+
+    class GoodHandler(Handler):
+        related = {'member': (Membership, 'user_id')}
+
+    assert RelatedLoader.relations(GoodHandler)['member'] == (Membership, 'user_id')
+
+
+@pytest.mark.asyncio
+async def test_expand_uses_one_query_per_model_and_caches():
+    conn = FakeConnection(
+        [{"client_id": 1, "client": "one"}, {"client_id": 2, "client": "two"}]
+    )
+    loader = RelatedLoader(conn)
+    relations = RelatedLoader.relations(Handler)
+    rows = [
+        {"program_id": 10, "client_id": 1},
+        {"program_id": 11, "client_id": 2},
+        {"program_id": 12, "client_id": 1},
+        {"program_id": 13, "client_id": 3},
+    ]
+    result = await loader.expand(rows, ['client_id'], relations)
+    assert len(conn.queries) == 1
+    assert conn.queries[0][1] == [1, 2, 3]
+    assert result[0]['_expanded']['client_id']['client'] == 'one'
+    assert result[1]['_expanded']['client_id']['client'] == 'two'
+    assert result[3]['_expanded']['client_id'] is None
+    # cached values (found or not) are not queried again:
+    row = await loader.expand({"program_id": 14, "client_id": 3}, ['client_id'], relations)
+    assert row['_expanded']['client_id'] is None
+    assert len(conn.queries) == 1
@@ -0,0 +1,58 @@
+"""Tests for the Slow Query Log."""
+import asyncio
+import pytest
+from navigator_admin.slowlog import SlowQueryLog
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.explained = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def fetch_all(self, sql, *args):
+        self.explained.append((sql, args))
+        return [("Index Scan using users_pkey on users",)]
+
+
+class FakeDB:
+    def __init__(self, connection) -> None:
+        self.connection = connection
+
+    async def acquire(self):
+        return self.connection
+
+
+@pytest.mark.asyncio
+async def test_slow_queries_are_redacted_and_explained():
+    conn = FakeConnection()
+    slowlog = SlowQueryLog(threshold=0, explain_rate=1.0)
+    slowlog._app = {'database': FakeDB(conn), 'authdb': None}
+    sql = "SELECT * FROM auth.users WHERE password = $1 AND pin = $2 AND user_id = $3"
+    async with slowlog.track(
+        'users', 'get', 'get', sql, ['s3cr3t', '1234', 10],
+        columns=['password', 'pin', 'user_id'],
+        sensitive=['pin'],
+        db_name='database'
+    ):
+        pass
+    await asyncio.gather(*slowlog._tasks)
+    entry = slowlog.entries()[0]
+    assert entry['db'] == 'database'
+    assert entry['params'] == ['******', '******', 10]
+    # EXPLAIN uses the real parameters:
+    assert conn.explained == [(f"EXPLAIN {sql}", ('s3cr3t', '1234', 10))]
+    assert entry['plan'] == "Index Scan using users_pkey on users"
+
+
+def test_fast_queries_and_unknown_columns():
+    slowlog = SlowQueryLog(threshold=1000)
+    assert slowlog.entries() == []
+    entry = slowlog.add('users', 'post', 'insert', 'INSERT ...', ['a'], 1500)
+    assert entry['db'] == 'authdb'
+    assert entry['params'] == ['******']
+    assert slowlog.entries() == [entry]
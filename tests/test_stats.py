@@ -0,0 +1,98 @@
+"""Tests for the Admin Dashboard statistics."""
+import asyncio
+from datetime import datetime
+import pytest
+from datamodel import BaseModel, Field
+from navigator_admin.stats import StatsRefresher
+
+
+class Customer(BaseModel):
+    customer_id: int = Field(primary_key=True)
+    updated_at: datetime
+
+    class Meta:
+        name = 'customers'
+
+
+class FakeConnection:
+    def __init__(self) -> None:
+        self.count = 10
+        self.reltuples = -1
+        self.queries = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def fetchval(self, sql, *args):
+        self.queries.append(sql)
+        if 'reltuples' in sql:
+            return self.reltuples
+        return self.count
+
+    async def fetch_one(self, sql, *args):
+        self.queries.append(sql)
+        if 'FILTER' in sql:
+            return {"rows": self.count, "recent": 2, "watermark": datetime(2024, 1, 1)}
+        return {"changes": 1, "watermark": datetime(2024, 1, 2)}
+
+
+class FakeDB:
+    def __init__(self, connection) -> None:
+        self.connection = connection
+
+    async def acquire(self):
+        return self.connection
+
+
+@pytest.mark.asyncio
+async def test_incremental_growth_uses_the_same_source():
+    conn = FakeConnection()
+    stats = StatsRefresher(incremental=True)
+    stats.register('customers', Customer)
+    stats._db = FakeDB(conn)
+    await stats.refresh()
+    assert stats.get('customers')['source'] == 'count'
+    # never analyzed: reltuples is -1, falls back to an exact count:
+    conn.count = 12
+    await stats.refresh()
+    stat = stats.get('customers')
+    assert (stat['rows'], stat['source'], stat['growth']) == (12, 'count', 2)
+    # the planner estimate is not compared with the exact count:
+    conn.reltuples = 500
+    await stats.refresh()
+    stat = stats.get('customers')
+    assert (stat['rows'], stat['source'], stat['growth']) == (500, 'estimate', 0)
+    conn.reltuples = 510
+    await stats.refresh()
+    stat = stats.get('customers')
+    assert (stat['growth'], stat['growth_pct']) == (10, 2.0)
+
+
+class FailingDB:
+    def __init__(self, connection) -> None:
+        self.connection = connection
+        self.failures = 1
+
+    async def acquire(self):
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("database is unavailable")
+        return self.connection
+
+
+@pytest.mark.asyncio
+async def test_worker_survives_refresh_errors():
+    stats = StatsRefresher(interval=0.01)
+    stats.register('customers', Customer)
+    stats._db = FailingDB(FakeConnection())
+    stats._task = asyncio.create_task(stats._worker())
+    for _ in range(100):
+        if stats.get('customers'):
+            break
+        await asyncio.sleep(0.01)
+    assert not stats._task.done()
+    assert stats.get('customers')['rows'] == 10
+    await stats.stop()
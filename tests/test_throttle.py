@@ -0,0 +1,87 @@
+"""Tests for the Admin Login Throttle."""
+import asyncio
+from types import SimpleNamespace
+import pytest
+from aiohttp import web
+from navigator_admin.admin import AdminPanel
+from navigator_admin.throttle import LoginThrottle, TokenBucket
+
+
+def test_token_bucket_burst_and_wait():
+    bucket = TokenBucket(rate=1.0, burst=2)
+    assert bucket.consume() == 0
+    assert bucket.consume() == 0
+    wait = bucket.consume()
+    assert 0 < wait <= 1.0
+    bucket.penalize(2)
+    assert bucket.consume() > wait
+
+
+def test_throttle_by_ip_and_username():
+    throttle = LoginThrottle(ip_rate=0.01, ip_burst=3, user_rate=0.01, user_burst=1)
+    assert throttle.check('10.0.0.1', 'Admin') == 0
+    # usernames are case-insensitive:
+    assert throttle.check('10.0.0.2', 'admin') > 0
+    assert throttle.check('10.0.0.1') == 0
+    assert throttle.check('10.0.0.1') == 0
+    assert throttle.check('10.0.0.1') > 0
+    assert throttle.check('10.0.0.3') == 0
+    rejected = throttle.reject(1.2)
+    assert rejected.status == 429
+    assert rejected.headers['Retry-After'] == '2'
+
+
+def test_failed_login_penalty():
+    throttle = LoginThrottle(user_rate=0.01, user_burst=2, penalty=1.0)
+    throttle.failed('admin')
+    assert throttle.check('10.0.0.1', 'admin') == 0
+    assert throttle.check('10.0.0.1', 'admin') > 0
+
+
+def test_client_ip_from_forwarded_header():
+    request = SimpleNamespace(
+        remote='127.0.0.1',
+        headers={'X-Forwarded-For': '203.0.113.7, 10.0.0.1'}
+    )
+    assert LoginThrottle().client_ip(request) == '127.0.0.1'
+    throttle = LoginThrottle(forwarded_header='X-Forwarded-For')
+    assert throttle.client_ip(request) == '203.0.113.7'
+
+
+@pytest.mark.asyncio
+async def test_acquire_timeout_does_not_leak_slots():
+    throttle = LoginThrottle(max_concurrent=1, queue_timeout=0.01)
+    await throttle.acquire()
+    with pytest.raises(web.HTTPServiceUnavailable):
+        await throttle.acquire()
+    throttle.release()
+    # the slot is free again, with no permit lost on the timeout:
+    await asyncio.wait_for(throttle.acquire(), timeout=1)
+    throttle.release()
+    assert not throttle._semaphore.locked()
+
+
+class NoTokenBackend:
+    async def get_payload(self, request):
+        return 'admin', 'secret'
+
+    async def authenticate(self, request):
+        # userdata without a token:
+        return {"username": "admin"}
+
+
+class FakeApp(dict):
+    router = {'admin_index': SimpleNamespace(url_for=lambda: '/admin')}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize('throttle', [None, LoginThrottle()])
+async def test_login_key_errors_are_bad_requests(throttle):
+    app = FakeApp(auth=SimpleNamespace(backends={'BasicAuth': NoTokenBackend()}))
+    request = SimpleNamespace(method='POST', remote='127.0.0.1', headers={}, app=app)
+    panel = SimpleNamespace(title='Admin', uri_prefix='/admin', throttle=throttle)
+    with pytest.raises(web.HTTPBadRequest):
+        await AdminPanel.admin_login(panel, request)
+    if throttle is not None:
+        # the authentication slot was released:
+        assert not throttle._semaphore.locked()